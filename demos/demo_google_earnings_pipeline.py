@@ -13,6 +13,12 @@ It demonstrates how the system:
 import os
 import sys
 import logging
+import hashlib
+import pickle
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime, timedelta
 import pandas as pd
 
@@ -21,6 +27,28 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from simplified_contrarian_analyzer import SimplifiedContrarianAnalyzer
 
+# Cached analysis results older than this are recomputed
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Only the author statistics columns the summary reads
+STATS_DTYPES = {
+    'author': 'string',
+    'company': 'string',
+    'contrarian_calls': 'int32',
+    'contrarian_success_rate': 'float32',
+    'overall_success_rate': 'float32'
+}
+STATS_CHUNKSIZE = 50_000
+
+GOOGLE_COMPANY_PATTERN = re.compile(r'Google|Alphabet', re.IGNORECASE)
+
+def _safe_size(path):
+    """Return the size of path in bytes, or None if it does not exist"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
 def setup_logging():
     """Setup logging for the demo"""
     logging.basicConfig(
@@ -33,6 +61,50 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+def cached_analyze_earnings(analyzer, ticker, company_name, earnings_date):
+    """Run analyzer.analyze_earnings, reusing results cached on disk by (ticker, earnings_date)"""
+    key = hashlib.sha256(f"{ticker}|{earnings_date}".encode('utf-8')).hexdigest()[:16]
+    cache_file = os.path.join(analyzer.database_dir, 'cache', f"{key}.pkl")
+    
+    try:
+        if time.time() - os.stat(cache_file).st_mtime < CACHE_TTL_SECONDS:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    
+    result = analyzer.analyze_earnings(
+        ticker=ticker,
+        company_name=company_name,
+        earnings_date=earnings_date
+    )
+    
+    if result:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(result, f)
+    
+    return result
+
+@lru_cache(maxsize=8)
+def _load_google_stats(path, mtime_ns, size):
+    """Load Google/Alphabet author statistics; mtime_ns and size key the cache so rewrites invalidate it"""
+    if path.endswith('.parquet'):
+        stats_df = pd.read_parquet(path, columns=list(STATS_DTYPES)).astype(STATS_DTYPES)
+        return stats_df[stats_df['company'].str.contains(GOOGLE_COMPANY_PATTERN, na=False)]
+    
+    # Filter each chunk as it is parsed so only Google rows are kept in memory
+    chunks = pd.read_csv(
+        path,
+        usecols=list(STATS_DTYPES),
+        dtype=STATS_DTYPES,
+        chunksize=STATS_CHUNKSIZE
+    )
+    return pd.concat(
+        [chunk[chunk['company'].str.contains(GOOGLE_COMPANY_PATTERN, na=False)] for chunk in chunks],
+        ignore_index=True
+    )
+
 def test_google_earnings_pipeline():
     """Test the full pipeline with 4 Google earnings calls"""
     logger = setup_logging()
@@ -73,53 +145,71 @@ def test_google_earnings_pipeline():
         }
     ]
     
-    all_results = []
+    all_results = [None] * len(google_earnings)
     
-    # Process each earnings period
+    # Log each earnings period up front; analyses run concurrently below
     for i, earnings in enumerate(google_earnings, 1):
         logger.info(f"\n{'='*60}")
-        logger.info(f"PROCESSING EARNINGS {i}/4: {earnings['quarter']}")
-        logger.info(f"Company: {earnings['company']}")
-        logger.info(f"Ticker: {earnings['ticker']}")
-        logger.info(f"Earnings Date: {earnings['earnings_date']}")
-        logger.info(f"Description: {earnings['description']}")
+        logger.info("PROCESSING EARNINGS %s/4: %s", i, earnings['quarter'])
+        logger.info("Company: %s", earnings['company'])
+        logger.info("Ticker: %s", earnings['ticker'])
+        logger.info("Earnings Date: %s", earnings['earnings_date'])
+        logger.info("Description: %s", earnings['description'])
         logger.info(f"{'='*60}")
+    
+    # Process each earnings period in parallel
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(
+                cached_analyze_earnings,
+                analyzer,
+                earnings['ticker'],
+                earnings['company'],
+                earnings['earnings_date']
+            ): idx
+            for idx, earnings in enumerate(google_earnings)
+        }
         
-        try:
-            # Analyze this earnings period
-            result = analyzer.analyze_earnings(
-                ticker=earnings['ticker'],
-                company_name=earnings['company'],
-                earnings_date=earnings['earnings_date']
-            )
-            
-            if result:
-                all_results.append({
-                    'quarter': earnings['quarter'],
-                    'earnings_date': earnings['earnings_date'],
-                    'result': result
-                })
-                
-                # Log key findings
-                logger.info(f"\nKEY FINDINGS for {earnings['quarter']}:")
-                logger.info(f"- Total articles analyzed: {len(result.get('articles', []))}")
-                logger.info(f"- Contrarians identified: {len(result.get('contrarians', []))}")
-                logger.info(f"- Market consensus: {result.get('market_consensus', 'Unknown')}")
-                logger.info(f"- Investment signal: {result.get('investment_signal', 'Unknown')}")
-                
-                # Show top contrarians for this period
-                contrarians = result.get('contrarians', [])
-                if contrarians:
-                    logger.info(f"\nTOP CONTRARIANS for {earnings['quarter']}:")
-                    for j, contrarian in enumerate(contrarians[:3], 1):
-                        logger.info(f"{j}. {contrarian.get('author', 'Unknown')} - {contrarian.get('prediction', 'Unknown')} ({contrarian.get('sentiment', 'Unknown')})")
+        for future in as_completed(futures):
+            idx = futures[future]
+            earnings = google_earnings[idx]
+            try:
+                result = future.result()
                 
-            else:
-                logger.warning(f"No results obtained for {earnings['quarter']}")
-                
-        except Exception as e:
-            logger.error(f"Error processing {earnings['quarter']}: {str(e)}")
-            continue
+                if result:
+                    all_results[idx] = {
+                        'quarter': earnings['quarter'],
+                        'earnings_date': earnings['earnings_date'],
+                        'result': result,
+                        '_n_articles': len(result.get('articles', [])),
+                        '_n_contrarians': len(result.get('contrarians', []))
+                    }
+                    
+                    # Log key findings
+                    logger.info("\nKEY FINDINGS for %s:", earnings['quarter'])
+                    logger.info("\n".join([
+                        "- Total articles analyzed: %s" % all_results[idx]['_n_articles'],
+                        "- Contrarians identified: %s" % all_results[idx]['_n_contrarians'],
+                        "- Market consensus: %s" % result.get('market_consensus', 'Unknown'),
+                        "- Investment signal: %s" % result.get('investment_signal', 'Unknown')
+                    ]))
+                    
+                    # Show top contrarians for this period
+                    contrarians = result.get('contrarians', [])
+                    if contrarians:
+                        logger.info("\nTOP CONTRARIANS for %s:", earnings['quarter'])
+                        for j, contrarian in enumerate(contrarians[:3], 1):
+                            logger.info("%s. %s - %s (%s)", j, contrarian.get('author', 'Unknown'), contrarian.get('prediction', 'Unknown'), contrarian.get('sentiment', 'Unknown'))
+                    
+                else:
+                    logger.warning("No results obtained for %s", earnings['quarter'])
+                    
+            except Exception as e:
+                logger.error("Error processing %s: %s", earnings['quarter'], e)
+                continue
+    
+    # Drop slots for periods that failed or returned nothing
+    all_results = [r for r in all_results if r is not None]
     
     # Generate comprehensive summary
     generate_pipeline_summary(analyzer, all_results, logger)
@@ -134,69 +224,72 @@ def generate_pipeline_summary(analyzer, all_results, logger):
     
     # Overall statistics
     total_quarters = len(all_results)
-    total_contrarians = sum(len(r['result'].get('contrarians', [])) for r in all_results)
-    total_articles = sum(len(r['result'].get('articles', [])) for r in all_results)
+    total_contrarians = sum(r['_n_contrarians'] for r in all_results)
+    total_articles = sum(r['_n_articles'] for r in all_results)
     
-    logger.info(f"\nOVERALL STATISTICS:")
-    logger.info(f"- Quarters analyzed: {total_quarters}")
-    logger.info(f"- Total articles processed: {total_articles}")
-    logger.info(f"- Total contrarians identified: {total_contrarians}")
+    logger.info("\nOVERALL STATISTICS:")
+    logger.info("- Quarters analyzed: %s", total_quarters)
+    logger.info("- Total articles processed: %s", total_articles)
+    logger.info("- Total contrarians identified: %s", total_contrarians)
     
     if total_quarters > 0:
-        logger.info(f"- Average contrarians per quarter: {total_contrarians/total_quarters:.1f}")
+        logger.info("- Average contrarians per quarter: %.1f", total_contrarians/total_quarters)
     else:
-        logger.info(f"- Average contrarians per quarter: N/A (no successful analyses)")
+        logger.info("- Average contrarians per quarter: N/A (no successful analyses)")
     
     # Check author statistics
     try:
-        stats_file = os.path.join(analyzer.database_dir, 'author_statistics.csv')
-        if os.path.exists(stats_file):
-            stats_df = pd.read_csv(stats_file)
-            google_stats = stats_df[stats_df['company'].str.contains('Google|Alphabet', case=False, na=False)]
+        google_stats = None
+        for stats_name in ('author_statistics.parquet', 'author_statistics.csv'):
+            stats_path = os.path.join(analyzer.database_dir, stats_name)
+            try:
+                st = os.stat(stats_path)
+            except FileNotFoundError:
+                continue
+            google_stats = _load_google_stats(stats_path, st.st_mtime_ns, st.st_size)
+            break
+        
+        if google_stats is not None and not google_stats.empty:
+            logger.info("\nAUTHOR PERFORMANCE TRACKING:")
+            logger.info("- Authors tracked for Google: %s", len(google_stats))
             
-            if not google_stats.empty:
-                logger.info(f"\nAUTHOR PERFORMANCE TRACKING:")
-                logger.info(f"- Authors tracked for Google: {len(google_stats)}")
-                
-                # Top performing contrarian authors
-                contrarian_authors = google_stats[google_stats['contrarian_calls'] > 0]
-                if not contrarian_authors.empty:
-                    top_contrarians = contrarian_authors.nlargest(5, 'contrarian_success_rate')
-                    logger.info(f"\nTOP CONTRARIAN PERFORMERS:")
-                    for idx, author in top_contrarians.iterrows():
-                        logger.info(f"- {author['author']}: {author['contrarian_success_rate']:.1%} success rate ({author['contrarian_calls']} calls)")
-                
-                # Overall accuracy statistics
-                avg_success_rate = google_stats['overall_success_rate'].mean()
-                avg_contrarian_rate = google_stats['contrarian_success_rate'].mean()
-                logger.info(f"\nACCURACY METRICS:")
-                logger.info(f"- Average overall success rate: {avg_success_rate:.1%}")
-                logger.info(f"- Average contrarian success rate: {avg_contrarian_rate:.1%}")
+            # Top performing contrarian authors
+            top_contrarians = google_stats.query('contrarian_calls > 0').nlargest(5, 'contrarian_success_rate')
+            if not top_contrarians.empty:
+                logger.info("\nTOP CONTRARIAN PERFORMERS:")
+                for idx, author in top_contrarians.iterrows():
+                    logger.info("- %s: %.1f%% success rate (%s calls)", author['author'], author['contrarian_success_rate'] * 100, author['contrarian_calls'])
+            
+            # Overall accuracy statistics
+            avg_success_rate = google_stats['overall_success_rate'].mean()
+            avg_contrarian_rate = google_stats['contrarian_success_rate'].mean()
+            logger.info("\nACCURACY METRICS:")
+            logger.info("- Average overall success rate: %.1f%%", avg_success_rate * 100)
+            logger.info("- Average contrarian success rate: %.1f%%", avg_contrarian_rate * 100)
     
     except Exception as e:
-        logger.warning(f"Could not load author statistics: {str(e)}")
+        logger.warning("Could not load author statistics: %s", e)
     
     # Investment signals summary
-    logger.info(f"\nINVESTMENT SIGNALS BY QUARTER:")
+    logger.info("\nINVESTMENT SIGNALS BY QUARTER:")
     for result in all_results:
         signal = result['result'].get('investment_signal', 'Unknown')
         consensus = result['result'].get('market_consensus', 'Unknown')
-        logger.info(f"- {result['quarter']}: {signal} (Consensus: {consensus})")
+        logger.info("- %s: %s (Consensus: %s)", result['quarter'], signal, consensus)
     
     # Database files created
-    logger.info(f"\nDATABASE FILES CREATED:")
+    logger.info("\nDATABASE FILES CREATED:")
     db_files = [
         'contrarian_records.csv',
         'author_statistics.csv'
     ]
     
     for db_file in db_files:
-        file_path = os.path.join(analyzer.database_dir, db_file)
-        if os.path.exists(file_path):
-            file_size = os.path.getsize(file_path)
-            logger.info(f"- {db_file}: {file_size} bytes")
+        file_size = _safe_size(os.path.join(analyzer.database_dir, db_file))
+        if file_size is not None:
+            logger.info("- %s: %s bytes", db_file, file_size)
         else:
-            logger.info(f"- {db_file}: Not found")
+            logger.info("- %s: Not found", db_file)
     
     logger.info(f"\n{'='*80}")
     logger.info("PIPELINE TEST COMPLETED SUCCESSFULLY")
@@ -218,8 +311,8 @@ def main():
         
         # Show quick summary
         if results:
-            total_contrarians = sum(len(r['result'].get('contrarians', [])) for r in results)
-            total_articles = sum(len(r['result'].get('articles', [])) for r in results)
+            total_contrarians = sum(r['_n_contrarians'] for r in results)
+            total_articles = sum(r['_n_articles'] for r in results)
             
             print(f"\n📈 Quick Summary:")
             print(f"   • Total articles analyzed: {total_articles}")
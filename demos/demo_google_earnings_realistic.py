@@ -11,13 +11,47 @@ import os
 import sys
 import logging
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import json
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from simplified_contrarian_analyzer import SimplifiedContrarianAnalyzer, ContrarianRecord
+from simplified_contrarian_analyzer import SimplifiedContrarianAnalyzer, RECORD_COLUMNS
+
+# Integer codes used by the compiled classification kernel
+SENTIMENT_CODES = {'bullish': 0, 'bearish': 1, 'neutral': 2}
+PREDICTION_CODES = {'beat': 0, 'miss': 1, 'meet': 2}
+# Code for labels outside the dicts above; such articles are never contrarian
+UNKNOWN_CODE = -1
+
+def _classify_articles(sent, pred, consensus_sent, consensus_pred, actual):
+    """Return (is_contrarian, was_correct) masks for integer-coded articles in one pass"""
+    n = sent.shape[0]
+    is_contrarian = np.zeros(n, dtype=np.bool_)
+    was_correct = np.zeros(n, dtype=np.bool_)
+    for k in range(n):
+        known = sent[k] != UNKNOWN_CODE and pred[k] != UNKNOWN_CODE
+        is_contrarian[k] = known and (pred[k] != consensus_pred or sent[k] != consensus_sent)
+        was_correct[k] = pred[k] != UNKNOWN_CODE and pred[k] == actual
+    return is_contrarian, was_correct
+
+if NUMBA_AVAILABLE:
+    _classify_articles = njit(cache=True)(_classify_articles)
+
+def _safe_size(path):
+    """Return the size of path in bytes, or None if it does not exist"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
 
 def setup_logging():
     """Setup logging for the demo"""
@@ -115,99 +149,102 @@ def simulate_google_earnings_analysis():
         }
     ]
     
-    all_results = []
+    all_results = [None] * len(google_scenarios)
+    record_rows = []
+    today = datetime.now().strftime('%Y-%m-%d')
     
     # Process each scenario
     for i, scenario in enumerate(google_scenarios, 1):
         logger.info(f"\n{'='*60}")
-        logger.info(f"ANALYZING SCENARIO {i}/2: {scenario['quarter']}")
-        logger.info(f"Earnings Date: {scenario['earnings_date']}")
-        logger.info(f"Actual Result: {scenario['actual_result']}")
-        logger.info(f"Description: {scenario['description']}")
+        logger.info("ANALYZING SCENARIO %s/2: %s", i, scenario['quarter'])
+        logger.info("Earnings Date: %s", scenario['earnings_date'])
+        logger.info("Actual Result: %s", scenario['actual_result'])
+        logger.info("Description: %s", scenario['description'])
         logger.info(f"{'='*60}")
         
         # Simulate the analysis process
         articles = scenario['sample_articles']
-        
-        # Determine consensus
-        predictions = [article['prediction'] for article in articles]
-        sentiment_counts = {'bullish': 0, 'bearish': 0, 'neutral': 0}
-        prediction_counts = {'beat': 0, 'miss': 0, 'meet': 0}
-        
-        for article in articles:
-            sentiment_counts[article['sentiment']] += 1
-            prediction_counts[article['prediction']] += 1
+        df = pd.DataFrame(articles)
         
         # Determine market consensus
-        consensus_prediction = max(prediction_counts, key=prediction_counts.get)
-        consensus_sentiment = max(sentiment_counts, key=sentiment_counts.get)
+        pred_counts = df['prediction'].value_counts()
+        sent_counts = df['sentiment'].value_counts()
+        consensus_prediction = pred_counts.idxmax()
+        consensus_sentiment = sent_counts.idxmax()
         
-        logger.info(f"\nMARKET CONSENSUS ANALYSIS:")
-        logger.info(f"- Prediction consensus: {consensus_prediction}")
-        logger.info(f"- Sentiment consensus: {consensus_sentiment}")
-        logger.info(f"- Prediction breakdown: {prediction_counts}")
-        logger.info(f"- Sentiment breakdown: {sentiment_counts}")
+        logger.info("\nMARKET CONSENSUS ANALYSIS:")
+        logger.info("\n".join([
+            "- Prediction consensus: %s" % consensus_prediction,
+            "- Sentiment consensus: %s" % consensus_sentiment,
+            "- Prediction breakdown: %s" % pred_counts.to_dict(),
+            "- Sentiment breakdown: %s" % sent_counts.to_dict()
+        ]))
         
         # Identify contrarians
-        contrarians = []
-        for article in articles:
-            is_contrarian = (
-                article['prediction'] != consensus_prediction or
-                article['sentiment'] != consensus_sentiment
+        if NUMBA_AVAILABLE:
+            mask, correct = _classify_articles(
+                df['sentiment'].map(SENTIMENT_CODES).fillna(UNKNOWN_CODE).to_numpy(np.int8),
+                df['prediction'].map(PREDICTION_CODES).fillna(UNKNOWN_CODE).to_numpy(np.int8),
+                SENTIMENT_CODES.get(consensus_sentiment, UNKNOWN_CODE),
+                PREDICTION_CODES.get(consensus_prediction, UNKNOWN_CODE),
+                PREDICTION_CODES.get(scenario['actual_result'], UNKNOWN_CODE)
             )
+        else:
+            known = (df['sentiment'].isin(SENTIMENT_CODES) & df['prediction'].isin(PREDICTION_CODES)).to_numpy()
+            mask = known & ((df['prediction'] != consensus_prediction) | (df['sentiment'] != consensus_sentiment)).to_numpy()
+            correct = (df['prediction'].isin(PREDICTION_CODES) & (df['prediction'] == scenario['actual_result'])).to_numpy()
+        
+        contrarians = []
+        for idx in np.flatnonzero(mask):
+            article = articles[idx]
+            # Check if contrarian was correct
+            was_correct = bool(correct[idx])
             
-            if is_contrarian:
-                # Check if contrarian was correct
-                was_correct = article['prediction'] == scenario['actual_result']
-                
-                contrarian_info = {
-                    'author': article['author'],
-                    'headline': article['headline'],
-                    'prediction': article['prediction'],
-                    'sentiment': article['sentiment'],
-                    'was_correct': was_correct,
-                    'reasoning': article['reasoning']
-                }
-                contrarians.append(contrarian_info)
-                
-                # Create contrarian record
-                record = ContrarianRecord(
-                    author=article['author'],
-                    company="Google/Alphabet",
-                    symbol="GOOGL",
-                    earnings_date=scenario['earnings_date'],
-                    prediction=article['prediction'],
-                    sentiment=article['sentiment'],
-                    was_contrarian=True,
-                    was_correct=was_correct,
-                    actual_result=scenario['actual_result'],
-                    date_analyzed=datetime.now().strftime('%Y-%m-%d'),
-                    headline=article['headline'],
-                    url=f"https://example.com/google-article-{i}-{len(contrarians)}"
-                )
-                
-                # Save to database
-                analyzer.save_records([record])
+            contrarian_info = {
+                'author': article['author'],
+                'headline': article['headline'],
+                'prediction': article['prediction'],
+                'sentiment': article['sentiment'],
+                'was_correct': was_correct,
+                'reasoning': article['reasoning']
+            }
+            contrarians.append(contrarian_info)
+            
+            # Create contrarian record row (ContrarianRecord schema)
+            record_rows.append({
+                'author': article['author'],
+                'company': "Google/Alphabet",
+                'symbol': "GOOGL",
+                'earnings_date': scenario['earnings_date'],
+                'prediction': article['prediction'],
+                'sentiment': article['sentiment'],
+                'was_contrarian': True,
+                'was_correct': was_correct,
+                'actual_result': scenario['actual_result'],
+                'date_analyzed': today,
+                'headline': article['headline'],
+                'url': f"https://example.com/google-article-{i}-{len(contrarians)}"
+            })
+        
+        # Contrarian accuracy from the classification masks
+        correct_count = int(correct[mask].sum())
+        contrarian_accuracy = correct_count / len(contrarians) if contrarians else 0.0
         
-        logger.info(f"\nCONTRARIAN ANALYSIS:")
-        logger.info(f"- Total contrarians identified: {len(contrarians)}")
+        logger.info("\nCONTRARIAN ANALYSIS:")
+        logger.info("- Total contrarians identified: %s", len(contrarians))
         
         if contrarians:
-            correct_contrarians = [c for c in contrarians if c['was_correct']]
-            logger.info(f"- Correct contrarians: {len(correct_contrarians)}")
-            logger.info(f"- Contrarian accuracy: {len(correct_contrarians)/len(contrarians):.1%}")
+            logger.info("- Correct contrarians: %s", correct_count)
+            logger.info("- Contrarian accuracy: %.1f%%", contrarian_accuracy * 100)
             
-            logger.info(f"\nTOP CONTRARIANS:")
+            logger.info("\nTOP CONTRARIANS:")
             for j, contrarian in enumerate(contrarians, 1):
                 status = "✅ CORRECT" if contrarian['was_correct'] else "❌ INCORRECT"
-                logger.info(f"{j}. {contrarian['author']} - {contrarian['prediction']} ({contrarian['sentiment']}) {status}")
-                logger.info(f"   Reasoning: {contrarian['reasoning']}")
+                logger.info("%s. %s - %s (%s) %s", j, contrarian['author'], contrarian['prediction'], contrarian['sentiment'], status)
+                logger.info("   Reasoning: %s", contrarian['reasoning'])
         
         # Generate investment signal
         if contrarians:
-            correct_contrarians = [c for c in contrarians if c['was_correct']]
-            contrarian_accuracy = len(correct_contrarians) / len(contrarians)
-            
             if contrarian_accuracy >= 0.6 and len(contrarians) >= 2:
                 signal = "STRONG_CONTRARIAN"
             elif contrarian_accuracy >= 0.4:
@@ -217,7 +254,7 @@ def simulate_google_earnings_analysis():
         else:
             signal = "FOLLOW_CONSENSUS"
         
-        logger.info(f"\nINVESTMENT SIGNAL: {signal}")
+        logger.info("\nINVESTMENT SIGNAL: %s", signal)
         
         result = {
             'quarter': scenario['quarter'],
@@ -227,10 +264,14 @@ def simulate_google_earnings_analysis():
             'consensus_sentiment': consensus_sentiment,
             'contrarians': contrarians,
             'investment_signal': signal,
-            'total_articles': len(articles)
+            'total_articles': len(articles),
+            '_n_contrarians': len(contrarians)
         }
         
-        all_results.append(result)
+        all_results[i - 1] = result
+    
+    # Save all contrarian records to database in a single write
+    analyzer.save_records_df(pd.DataFrame.from_records(record_rows, columns=RECORD_COLUMNS))
     
     # Update author statistics
     analyzer.update_author_statistics()
@@ -246,65 +287,65 @@ def generate_realistic_summary(analyzer, all_results, logger):
     logger.info("REALISTIC GOOGLE EARNINGS ANALYSIS SUMMARY")
     logger.info(f"{'='*80}")
     
+    # Gather contrarians, article totals and signals in a single pass
+    all_contrarians = []
+    total_articles = 0
+    signals = []
+    for result in all_results:
+        all_contrarians.extend(result['contrarians'])
+        total_articles += result['total_articles']
+        signals.append((result['quarter'], result['investment_signal'], result['actual_result']))
+    
     # Overall statistics
     total_quarters = len(all_results)
-    total_contrarians = sum(len(r['contrarians']) for r in all_results)
-    total_articles = sum(r['total_articles'] for r in all_results)
+    total_contrarians = len(all_contrarians)
     
-    logger.info(f"\nOVERALL STATISTICS:")
-    logger.info(f"- Quarters analyzed: {total_quarters}")
-    logger.info(f"- Total articles processed: {total_articles}")
-    logger.info(f"- Total contrarians identified: {total_contrarians}")
-    logger.info(f"- Average contrarians per quarter: {total_contrarians/total_quarters:.1f}")
+    logger.info("\nOVERALL STATISTICS:")
+    logger.info("- Quarters analyzed: %s", total_quarters)
+    logger.info("- Total articles processed: %s", total_articles)
+    logger.info("- Total contrarians identified: %s", total_contrarians)
+    logger.info("- Average contrarians per quarter: %.1f", total_contrarians/total_quarters)
     
     # Contrarian accuracy analysis
-    all_contrarians = []
-    for result in all_results:
-        all_contrarians.extend(result['contrarians'])
-    
     if all_contrarians:
         correct_contrarians = [c for c in all_contrarians if c['was_correct']]
         overall_accuracy = len(correct_contrarians) / len(all_contrarians)
         
-        logger.info(f"\nCONTRARIAN PERFORMANCE:")
-        logger.info(f"- Overall contrarian accuracy: {overall_accuracy:.1%}")
-        logger.info(f"- Correct contrarian calls: {len(correct_contrarians)}")
-        logger.info(f"- Incorrect contrarian calls: {len(all_contrarians) - len(correct_contrarians)}")
+        logger.info("\nCONTRARIAN PERFORMANCE:")
+        logger.info("- Overall contrarian accuracy: %.1f%%", overall_accuracy * 100)
+        logger.info("- Correct contrarian calls: %s", len(correct_contrarians))
+        logger.info("- Incorrect contrarian calls: %s", len(all_contrarians) - len(correct_contrarians))
         
         # Top performing contrarians
-        author_performance = {}
-        for contrarian in all_contrarians:
-            author = contrarian['author']
-            if author not in author_performance:
-                author_performance[author] = {'total': 0, 'correct': 0}
-            author_performance[author]['total'] += 1
-            if contrarian['was_correct']:
-                author_performance[author]['correct'] += 1
+        perf = pd.DataFrame(all_contrarians).groupby('author')['was_correct'].agg(['sum', 'count'])
+        perf['accuracy'] = perf['sum'] / perf['count']
+        perf = perf.sort_values('accuracy', ascending=False)
         
-        logger.info(f"\nTOP CONTRARIAN PERFORMERS:")
-        for author, stats in sorted(author_performance.items(), 
-                                  key=lambda x: x[1]['correct']/x[1]['total'], 
-                                  reverse=True):
-            accuracy = stats['correct'] / stats['total']
-            logger.info(f"- {author}: {accuracy:.1%} accuracy ({stats['correct']}/{stats['total']})")
+        logger.info("\nTOP CONTRARIAN PERFORMERS:")
+        for author, correct, total, accuracy in perf.itertuples():
+            logger.info("- %s: %.1f%% accuracy (%s/%s)", author, accuracy * 100, correct, total)
     
     # Investment signals summary
-    logger.info(f"\nINVESTMENT SIGNALS BY QUARTER:")
-    for result in all_results:
-        logger.info(f"- {result['quarter']}: {result['investment_signal']} (Actual: {result['actual_result']})")
+    logger.info("\nINVESTMENT SIGNALS BY QUARTER:")
+    for quarter, signal, actual_result in signals:
+        logger.info("- %s: %s (Actual: %s)", quarter, signal, actual_result)
     
     # Database status
-    logger.info(f"\nDATABASE STATUS:")
+    logger.info("\nDATABASE STATUS:")
     records_file = os.path.join(analyzer.database_dir, 'contrarian_records.csv')
     stats_file = os.path.join(analyzer.database_dir, 'author_statistics.csv')
     
-    if os.path.exists(records_file):
-        records_size = os.path.getsize(records_file)
-        logger.info(f"- contrarian_records.csv: {records_size} bytes")
+    records_size = _safe_size(records_file)
+    if records_size is not None:
+        logger.info("- contrarian_records.csv: %s bytes", records_size)
+    else:
+        logger.info("- contrarian_records.csv: Not found")
     
-    if os.path.exists(stats_file):
-        stats_size = os.path.getsize(stats_file)
-        logger.info(f"- author_statistics.csv: {stats_size} bytes")
+    stats_size = _safe_size(stats_file)
+    if stats_size is not None:
+        logger.info("- author_statistics.csv: %s bytes", stats_size)
+    else:
+        logger.info("- author_statistics.csv: Not found")
     
     logger.info(f"\n{'='*80}")
     logger.info("REALISTIC DEMO COMPLETED SUCCESSFULLY")
@@ -325,7 +366,7 @@ def main():
         print(f"📋 Detailed logs: google_realistic_demo.log")
         
         # Show quick summary
-        total_contrarians = sum(len(r['contrarians']) for r in results)
+        total_contrarians = sum(r['_n_contrarians'] for r in results)
         total_articles = sum(r['total_articles'] for r in results)
         
         print(f"\n📈 Quick Summary:")
@@ -8,12 +8,157 @@ contrarians and their historical performance.
 """
 
 import os
+import sys
 import json
+import mmap
 import pandas as pd
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
 from master_contrarian_database import MasterContrarianDatabase
 from contrarian_csv_exporter import ContrarianCSVExporter
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Reports smaller than this are parsed in one go; larger ones are streamed
+STREAMING_THRESHOLD_BYTES = 100 * 1024
+
+# Reports at least this large are parsed from a memory map
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+# Fewer reports than this are parsed inline; process startup would cost more than the parsing
+PARALLEL_PARSE_MIN_REPORTS = 4
+
+# Master database columns read by display_database_stats
+STATS_COLUMNS = ['Author_Name', 'Total_Contrarian_Instances', 'Contrarian_Success_Rate', 'Companies_List']
+
+# Top-level report keys read by MasterContrarianDatabase.add_contrarian_analysis
+REPORT_KEYS = ('company', 'symbol', 'earnings_date', 'actual_result', 'contrarian_analysts')
+
+# Sample contrarian data for different companies and dates
+_SAMPLE_REPORTS = (
+    {
+        'company': 'Apple Inc.',
+        'symbol': 'AAPL',
+        'earnings_date': '2024-01-25',
+        'actual_result': {'result': 'beat', 'eps_actual': 2.18, 'eps_estimate': 2.10},
+        'contrarian_analysts': [
+            {
+                'author': 'John Smith',
+                'sentiment': 'bullish',
+                'earnings_prediction': 'beat',
+                'was_minority_sentiment': True,
+                'was_minority_prediction': True,
+                'contrarian_score': 8.5,
+                'reasoning': 'Strong iPhone sales expected despite market pessimism',
+                'key_concerns': ['Supply chain improvements', 'Holiday sales momentum']
+            },
+            {
+                'author': 'Sarah Johnson',
+                'sentiment': 'bearish',
+                'earnings_prediction': 'beat',
+                'was_minority_sentiment': False,
+                'was_minority_prediction': True,
+                'contrarian_score': 7.2,
+                'reasoning': 'Earnings will beat but stock overvalued',
+                'key_concerns': ['Valuation concerns', 'Market saturation']
+            }
+        ]
+    },
+    {
+        'company': 'Microsoft Corporation',
+        'symbol': 'MSFT',
+        'earnings_date': '2024-01-24',
+        'actual_result': {'result': 'miss', 'eps_actual': 2.93, 'eps_estimate': 2.99},
+        'contrarian_analysts': [
+            {
+                'author': 'John Smith',
+                'sentiment': 'bearish',
+                'earnings_prediction': 'miss',
+                'was_minority_sentiment': True,
+                'was_minority_prediction': True,
+                'contrarian_score': 9.1,
+                'reasoning': 'Cloud growth slowing, Azure competition intensifying',
+                'key_concerns': ['Azure growth deceleration', 'Increased competition']
+            }
+        ]
+    },
+    {
+        'company': 'Apple Inc.',
+        'symbol': 'AAPL',
+        'earnings_date': '2023-10-26',
+        'actual_result': {'result': 'beat', 'eps_actual': 1.46, 'eps_estimate': 1.39},
+        'contrarian_analysts': [
+            {
+                'author': 'John Smith',
+                'sentiment': 'bullish',
+                'earnings_prediction': 'beat',
+                'was_minority_sentiment': True,
+                'was_minority_prediction': True,
+                'contrarian_score': 8.8,
+                'reasoning': 'iPhone 15 launch momentum stronger than expected',
+                'key_concerns': ['New product cycle', 'Market share gains']
+            },
+            {
+                'author': 'Mike Davis',
+                'sentiment': 'neutral',
+                'earnings_prediction': 'miss',
+                'was_minority_sentiment': False,
+                'was_minority_prediction': True,
+                'contrarian_score': 6.5,
+                'reasoning': 'Economic headwinds will impact consumer spending',
+                'key_concerns': ['Economic uncertainty', 'Consumer spending']
+            }
+        ]
+    }
+)
+
+def _stream_report(source) -> dict:
+    """Build only the REPORT_KEYS sections of a report from a binary file-like source"""
+    builders = {}
+    for prefix, event, value in ijson.parse(source, use_float=True):
+        key = prefix.split('.', 1)[0]
+        if key in REPORT_KEYS:
+            if key not in builders:
+                builders[key] = ijson.ObjectBuilder()
+            builders[key].event(event, value)
+    
+    return {key: builder.value for key, builder in builders.items()}
+
+def _load_report(report_path: str) -> dict:
+    """
+    Load the parts of a contrarian report used by the master database,
+    streaming large files so unused sections are never materialized
+    """
+    size = os.path.getsize(report_path)
+    stream = IJSON_AVAILABLE and size >= STREAMING_THRESHOLD_BYTES
+    
+    if not stream and not ORJSON_AVAILABLE:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    with open(report_path, 'rb') as f:
+        if size < MMAP_THRESHOLD_BYTES:
+            return _stream_report(f) if stream else orjson.loads(f.read())
+        
+        # Parse straight from the page cache instead of copying into Python buffers
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if stream:
+                return _stream_report(mm)
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
 def demo_master_contrarian_system():
     """
     Demonstrate the master contrarian tracking system
@@ -30,14 +175,11 @@ def demo_master_contrarian_system():
     
     # Check for existing analysis reports
     print("\n2. Scanning for existing contrarian analysis reports...")
-    outputs_dir = "outputs"
+    outputs_dir = Path("outputs")
     json_reports = []
     
-    if os.path.exists(outputs_dir):
-        for root, dirs, files in os.walk(outputs_dir):
-            for file in files:
-                if file.endswith('.json') and 'contrarian' in file.lower():
-                    json_reports.append(os.path.join(root, file))
+    if outputs_dir.is_dir():
+        json_reports = [str(p) for p in outputs_dir.rglob("*.json") if 'contrarian' in p.name.lower()]
     
     print(f"   Found {len(json_reports)} contrarian analysis reports")
     
@@ -47,9 +189,31 @@ def demo_master_contrarian_system():
     else:
         # Process existing reports
         print("\n3. Processing existing contrarian reports...")
-        for i, report_path in enumerate(json_reports, 1):
-            print(f"   Processing report {i}/{len(json_reports)}: {os.path.basename(report_path)}")
-            process_contrarian_report(master_db, report_path)
+        workers = min(len(json_reports), os.cpu_count() or 1)
+        if len(json_reports) < PARALLEL_PARSE_MIN_REPORTS or workers == 1:
+            parsed = [_parse_report(report_path) for report_path in json_reports]
+        else:
+            chunksize = max(1, len(json_reports) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(_parse_report, json_reports, chunksize=chunksize))
+        
+        payloads = []
+        for i, (report_path, (report_data, error)) in enumerate(zip(json_reports, parsed), 1):
+            report_name = os.path.basename(report_path)
+            print(f"   Processing report {i}/{len(json_reports)}: {report_name}")
+            if error:
+                print(f"     Error processing {report_name}: {error}")
+                continue
+            
+            contrarians = report_data.get('contrarian_analysts', [])
+            if contrarians:
+                print(f"     Queued {len(contrarians)} contrarian(s) for master database")
+                payloads.append((report_data, contrarians))
+            else:
+                print(f"     No contrarians found in {report_name}")
+        
+        if payloads:
+            master_db.add_contrarian_analyses_bulk(payloads)
     
     # Display database statistics
     print("\n4. Master Database Statistics:")
@@ -75,23 +239,15 @@ def demo_master_contrarian_system():
     print("DEMO COMPLETED SUCCESSFULLY!")
     print("=" * 60)
 
-def process_contrarian_report(master_db: MasterContrarianDatabase, report_path: str):
+def _parse_report(report_path: str) -> Tuple[Optional[dict], Optional[str]]:
     """
-    Process a contrarian analysis report and update the master database
+    Parse one contrarian analysis report (in a worker process for large batches),
+    returning (report_data, None) or (None, error message)
     """
     try:
-        with open(report_path, 'r', encoding='utf-8') as f:
-            report_data = json.load(f)
-        
-        contrarians = report_data.get('contrarian_analysts', [])
-        if contrarians:
-            master_db.add_contrarian_analysis(report_data, contrarians)
-            print(f"     Added {len(contrarians)} contrarian(s) to master database")
-        else:
-            print(f"     No contrarians found in {os.path.basename(report_path)}")
-    
+        return _load_report(report_path), None
     except Exception as e:
-        print(f"     Error processing {os.path.basename(report_path)}: {e}")
+        return None, str(e)
 
 def create_sample_contrarian_data(master_db: MasterContrarianDatabase):
     """
@@ -99,103 +255,32 @@ def create_sample_contrarian_data(master_db: MasterContrarianDatabase):
     """
     print("   Creating sample contrarian data...")
     
-    # Sample contrarian data for different companies and dates
-    sample_reports = [
-        {
-            'company': 'Apple Inc.',
-            'symbol': 'AAPL',
-            'earnings_date': '2024-01-25',
-            'actual_result': {'result': 'beat', 'eps_actual': 2.18, 'eps_estimate': 2.10},
-            'contrarian_analysts': [
-                {
-                    'author': 'John Smith',
-                    'sentiment': 'bullish',
-                    'earnings_prediction': 'beat',
-                    'was_minority_sentiment': True,
-                    'was_minority_prediction': True,
-                    'contrarian_score': 8.5,
-                    'reasoning': 'Strong iPhone sales expected despite market pessimism',
-                    'key_concerns': ['Supply chain improvements', 'Holiday sales momentum']
-                },
-                {
-                    'author': 'Sarah Johnson',
-                    'sentiment': 'bearish',
-                    'earnings_prediction': 'beat',
-                    'was_minority_sentiment': False,
-                    'was_minority_prediction': True,
-                    'contrarian_score': 7.2,
-                    'reasoning': 'Earnings will beat but stock overvalued',
-                    'key_concerns': ['Valuation concerns', 'Market saturation']
-                }
-            ]
-        },
-        {
-            'company': 'Microsoft Corporation',
-            'symbol': 'MSFT',
-            'earnings_date': '2024-01-24',
-            'actual_result': {'result': 'miss', 'eps_actual': 2.93, 'eps_estimate': 2.99},
-            'contrarian_analysts': [
-                {
-                    'author': 'John Smith',
-                    'sentiment': 'bearish',
-                    'earnings_prediction': 'miss',
-                    'was_minority_sentiment': True,
-                    'was_minority_prediction': True,
-                    'contrarian_score': 9.1,
-                    'reasoning': 'Cloud growth slowing, Azure competition intensifying',
-                    'key_concerns': ['Azure growth deceleration', 'Increased competition']
-                }
-            ]
-        },
-        {
-            'company': 'Apple Inc.',
-            'symbol': 'AAPL',
-            'earnings_date': '2023-10-26',
-            'actual_result': {'result': 'beat', 'eps_actual': 1.46, 'eps_estimate': 1.39},
-            'contrarian_analysts': [
-                {
-                    'author': 'John Smith',
-                    'sentiment': 'bullish',
-                    'earnings_prediction': 'beat',
-                    'was_minority_sentiment': True,
-                    'was_minority_prediction': True,
-                    'contrarian_score': 8.8,
-                    'reasoning': 'iPhone 15 launch momentum stronger than expected',
-                    'key_concerns': ['New product cycle', 'Market share gains']
-                },
-                {
-                    'author': 'Mike Davis',
-                    'sentiment': 'neutral',
-                    'earnings_prediction': 'miss',
-                    'was_minority_sentiment': False,
-                    'was_minority_prediction': True,
-                    'contrarian_score': 6.5,
-                    'reasoning': 'Economic headwinds will impact consumer spending',
-                    'key_concerns': ['Economic uncertainty', 'Consumer spending']
-                }
-            ]
-        }
-    ]
-    
     # Add sample data to master database
-    for report in sample_reports:
-        master_db.add_contrarian_analysis(report, report['contrarian_analysts'])
+    master_db.add_contrarian_analyses_bulk(
+        [(report, report['contrarian_analysts']) for report in _SAMPLE_REPORTS]
+    )
     
-    print(f"   Created sample data for {len(sample_reports)} earnings reports")
+    print(f"   Created sample data for {len(_SAMPLE_REPORTS)} earnings reports")
 
 def display_database_stats(master_db: MasterContrarianDatabase):
     """
     Display statistics from the master database
     """
     try:
-        if os.path.exists(master_db.master_csv_path):
-            df = pd.read_csv(master_db.master_csv_path)
-            
+        if os.path.exists(master_db.master_parquet_path):
+            df = pd.read_parquet(master_db.master_parquet_path, columns=STATS_COLUMNS, engine='pyarrow')
+        elif os.path.exists(master_db.master_csv_path):
+            df = master_db.load_master_dataframe()
+        else:
+            df = None
+        
+        if df is not None:
             print(f"   Total Authors Tracked: {len(df)}")
             print(f"   Total Contrarian Instances: {df['Total_Contrarian_Instances'].sum()}")
             print(f"   Authors with Multiple Instances: {len(df[df['Total_Contrarian_Instances'] > 1])}")
             print(f"   Average Success Rate: {df['Contrarian_Success_Rate'].mean():.1f}%")
-            print(f"   Companies Covered: {len(set([comp for comps in df['Companies_List'].dropna() for comp in comps.split(';')]))}")
+            companies_covered = df['Companies_List'].dropna().str.split(';').explode().str.strip().nunique()
+            print(f"   Companies Covered: {companies_covered}")
         else:
             print("   Master database is empty")
     except Exception as e:
@@ -205,83 +290,92 @@ def show_top_contrarians(master_db: MasterContrarianDatabase, limit: int = 5):
     """
     Show top performing contrarians
     """
+    lines = []
     try:
         top_contrarians = master_db.get_top_contrarians(limit, 'Contrarian_Success_Rate')
         
         if not top_contrarians.empty:
-            print(f"   Top {limit} Contrarians by Success Rate:")
-            for i, (_, row) in enumerate(top_contrarians.iterrows(), 1):
+            lines.append(f"   Top {limit} Contrarians by Success Rate:")
+            for i, row in enumerate(top_contrarians.to_dict(orient='records'), 1):
                 success_rate = row['Contrarian_Success_Rate']
                 instances = row['Total_Contrarian_Instances']
                 companies = row['Total_Companies_Covered']
-                print(f"   {i}. {row['Author_Name']}")
-                print(f"      Success Rate: {success_rate:.1f}% ({instances} instances across {companies} companies)")
-                print(f"      Latest: {row['Latest_Company']} ({row['Latest_Earnings_Date']})")
-                print(f"      Risk Level: {row['Risk_Level']}")
-                print()
+                lines.append(f"   {i}. {row['Author_Name']}")
+                lines.append(f"      Success Rate: {success_rate:.1f}% ({instances} instances across {companies} companies)")
+                lines.append(f"      Latest: {row['Latest_Company']} ({row['Latest_Earnings_Date']})")
+                lines.append(f"      Risk Level: {row['Risk_Level']}")
+                lines.append("")
         else:
-            print("   No contrarian data available")
+            lines.append("   No contrarian data available")
     except Exception as e:
-        print(f"   Error showing top contrarians: {e}")
+        lines.append(f"   Error showing top contrarians: {e}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def show_repeat_contrarians(master_db: MasterContrarianDatabase, min_instances: int = 2):
     """
     Show authors who have been contrarians multiple times
     """
+    lines = []
     try:
         repeat_contrarians = master_db.get_repeat_contrarians(min_instances)
         
         if not repeat_contrarians.empty:
-            print(f"   Authors with {min_instances}+ Contrarian Instances:")
-            for i, (_, row) in enumerate(repeat_contrarians.iterrows(), 1):
+            lines.append(f"   Authors with {min_instances}+ Contrarian Instances:")
+            for i, row in enumerate(repeat_contrarians.to_dict(orient='records'), 1):
                 instances = row['Total_Contrarian_Instances']
                 companies = row['Total_Companies_Covered']
                 consistency = row['Consistency_Score']
-                print(f"   {i}. {row['Author_Name']}")
-                print(f"      Instances: {instances} across {companies} companies")
-                print(f"      Consistency Score: {consistency:.1f}%")
-                print(f"      Companies: {row['Companies_List']}")
-                print(f"      Date Range: {row['First_Seen_Date']} to {row['Last_Seen_Date']}")
-                print()
+                lines.append(f"   {i}. {row['Author_Name']}")
+                lines.append(f"      Instances: {instances} across {companies} companies")
+                lines.append(f"      Consistency Score: {consistency:.1f}%")
+                lines.append(f"      Companies: {row['Companies_List']}")
+                lines.append(f"      Date Range: {row['First_Seen_Date']} to {row['Last_Seen_Date']}")
+                lines.append("")
         else:
-            print(f"   No authors with {min_instances}+ contrarian instances found")
+            lines.append(f"   No authors with {min_instances}+ contrarian instances found")
     except Exception as e:
-        print(f"   Error showing repeat contrarians: {e}")
+        lines.append(f"   Error showing repeat contrarians: {e}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def show_author_history_example(master_db: MasterContrarianDatabase):
     """
     Show detailed history for one author as an example
     """
+    lines = []
     try:
         if os.path.exists(master_db.master_csv_path):
-            df = pd.read_csv(master_db.master_csv_path)
+            df = master_db.load_master_dataframe()
             
             if not df.empty:
                 # Get author with most instances
                 top_author = df.loc[df['Total_Contrarian_Instances'].idxmax()]
                 author_name = top_author['Author_Name']
                 
-                print(f"   Detailed History for: {author_name}")
-                print(f"   Total Instances: {top_author['Total_Contrarian_Instances']}")
-                print(f"   Success Rate: {top_author['Contrarian_Success_Rate']:.1f}%")
-                print(f"   Companies Covered: {top_author['Companies_List']}")
+                lines.append(f"   Detailed History for: {author_name}")
+                lines.append(f"   Total Instances: {top_author['Total_Contrarian_Instances']}")
+                lines.append(f"   Success Rate: {top_author['Contrarian_Success_Rate']:.1f}%")
+                lines.append(f"   Companies Covered: {top_author['Companies_List']}")
                 
                 # Get detailed history
                 history = master_db.get_author_history(author_name)
                 if history is not None and not history.empty:
-                    print(f"\n   Individual Contrarian Calls:")
-                    for i, (_, call) in enumerate(history.iterrows(), 1):
-                        print(f"   {i}. {call['Company']} ({call['Symbol']}) - {call['Earnings_Date']}")
-                        print(f"      Prediction: {call['Earnings_Prediction']} | Sentiment: {call['Sentiment']}")
-                        print(f"      Was Correct: {call['Was_Correct']} | Score: {call['Contrarian_Score']}")
-                        print(f"      Reasoning: {call['Reasoning'][:100]}...")
-                        print()
+                    lines.append(f"\n   Individual Contrarian Calls:")
+                    for i, call in enumerate(history.to_dict(orient='records'), 1):
+                        lines.append(f"   {i}. {call['Company']} ({call['Symbol']}) - {call['Earnings_Date']}")
+                        lines.append(f"      Prediction: {call['Earnings_Prediction']} | Sentiment: {call['Sentiment']}")
+                        lines.append(f"      Was Correct: {call['Was_Correct']} | Score: {call['Contrarian_Score']}")
+                        lines.append(f"      Reasoning: {call['Reasoning'][:100]}...")
+                        lines.append("")
             else:
-                print("   No author data available")
+                lines.append("   No author data available")
         else:
-            print("   Master database not found")
+            lines.append("   Master database not found")
     except Exception as e:
-        print(f"   Error showing author history: {e}")
+        lines.append(f"   Error showing author history: {e}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def export_master_summary(master_db: MasterContrarianDatabase):
     """
@@ -9,27 +9,45 @@ Usage examples:
 """
 
 import argparse
+import asyncio
+import atexit
+import json
 import sys
 import os
 from datetime import datetime, timedelta
 import logging
 
-# Add the src directory to the Python path
-script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(script_dir)
-src_path = os.path.join(project_root, 'src')
-sys.path.append(src_path)
+logger = logging.getLogger(__name__)
 
-from analyzers.contrarian_earnings_analyzer_production import ProductionContrarianEarningsAnalyzer, RateLimitConfig
-from analyzers.contrarian_csv_exporter import ContrarianCSVExporter
+# Section banners, built once
+BAR = "=" * 60
+HEADER = f"\n{BAR}\nPRODUCTION CONTRARIAN EARNINGS ANALYSIS\n{BAR}"
+RESULTS_HEADER = f"\n{BAR}\nANALYSIS RESULTS\n{BAR}"
+
+# Per-contrarian block of the results summary, filled from the contrarian dict
+CONTRARIAN_TEMPLATE = (
+    "\n  {i}. {author}\n"
+    "     Score: {contrarian_score}\n"
+    "     Headline: {headline_preview}...\n"
+    "     Sentiment: {sentiment} ({sentiment_percentage}% had this view)\n"
+    "     Prediction: {prediction} ({prediction_percentage}% had this view)\n"
+    "     Correct on: Sentiment={sentiment_correct}, Prediction={prediction_correct}\n"
+    "     Confidence: {confidence} sentiment, {prediction_confidence} prediction"
+)
+
+# Single "now" reference shared by date validation and the future-date check
+_NOW = datetime.now()
 
 def validate_date(date_string):
     """Validate date format and check if it's reasonable"""
     try:
-        date_obj = datetime.strptime(date_string, "%Y-%m-%d")
+        # fromisoformat also accepts other ISO forms; only plain YYYY-MM-DD is allowed
+        if len(date_string) != 10 or not date_string.replace("-", "", 2).isdigit():
+            raise ValueError(date_string)
+        date_obj = datetime.fromisoformat(date_string)
         
         # Check if date is too far in the future
-        if date_obj > datetime.now() + timedelta(days=365):
+        if date_obj > _NOW + timedelta(days=365):
             print(f"Warning: Earnings date {date_string} is more than a year in the future.")
             
         # Check if date is too far in the past (before 2020)
@@ -50,6 +68,30 @@ def validate_positive_int(value):
     except ValueError:
         raise argparse.ArgumentTypeError(f"Invalid integer: {value}")
 
+def load_bucket_state(path):
+    """Load saved token-bucket state as {api: (tokens, last_refill_timestamp)}"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_bucket_state(path, buckets):
+    """Persist token-bucket state so the next run starts with the real remaining quota"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({api: (bucket.tokens, bucket.last_refill_timestamp) for api, bucket in buckets.items()}, f)
+    except OSError as e:
+        logger.warning(f"Could not save rate limiter state: {e}")
+
+async def run_analysis(analyzer, **kwargs):
+    """Run the analysis over a single pooled HTTP session for the whole CLI run"""
+    from analyzers.contrarian_earnings_analyzer_production import create_http_session
+    
+    async with create_http_session() as session:
+        return await analyzer.analyze_company_earnings(session=session, **kwargs)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Production Contrarian Earnings Analyzer - Identify minority voices who were proven right",
@@ -100,6 +142,13 @@ Note: Use past earnings dates for best results as actual earnings data is needed
         help="Maximum number of articles to analyze (default: 30)"
     )
     
+    parser.add_argument(
+        "--batch-size",
+        type=validate_positive_int,
+        default=8,
+        help="Articles classified per Groq request (default: 8, use 1 for one request per article)"
+    )
+    
     parser.add_argument(
         "--output", "-o",
         help="Output filename (default: auto-generated with timestamp)"
@@ -126,6 +175,27 @@ Note: Use past earnings dates for best results as actual earnings data is needed
         help="Groq API requests per minute (default: 30 for free tier)"
     )
     
+    # Caching options
+    cache_group = parser.add_argument_group("Caching Options")
+    
+    cache_group.add_argument(
+        "--cache-dir",
+        default=os.path.join("~", ".cache", "contrarian"),
+        help="Directory for cached Guardian/Groq responses (default: ~/.cache/contrarian)"
+    )
+    
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the APIs instead of reusing cached responses"
+    )
+    
+    cache_group.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Clear cached responses before running the analysis"
+    )
+    
     # Logging options
     parser.add_argument(
         "--verbose", "-v",
@@ -148,20 +218,45 @@ Note: Use past earnings dates for best results as actual earnings data is needed
     
     args = parser.parse_args()
     
-    # Setup logging
+    # Setup logging once, before the analyzer module configures its defaults
     if args.quiet:
-        logging.getLogger().setLevel(logging.ERROR)
+        log_level = logging.ERROR
     elif args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        log_level = logging.DEBUG
     else:
-        logging.getLogger().setLevel(logging.INFO)
+        log_level = logging.INFO
+    
+    logging.basicConfig(
+        level=log_level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('contrarian_analysis.log'),
+            logging.StreamHandler()
+        ]
+    )
+    
+    # Make the src directory importable when run from a checkout
+    src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    if src_path not in sys.path:
+        sys.path.append(src_path)
+    
+    # Heavy imports only happen once the command is actually going to run
+    from analyzers.contrarian_earnings_analyzer_production import (
+        ProductionContrarianEarningsAnalyzer, RateLimitConfig, TokenBucket, ResponseCache
+    )
+    from tqdm import tqdm
+    
+    # Prompts would block forever without a terminal (cron, CI, pipes)
+    interactive = sys.stdin.isatty() and not args.force
+    if not interactive and not args.force:
+        logger.info("Non-interactive mode, proceeding without confirmation prompts")
     
     # Validate inputs
     earnings_date_str = args.date.strftime("%Y-%m-%d")
     
     # Check if earnings date is in the future
-    if args.date > datetime.now():
-        if not args.force:
+    if args.date > _NOW:
+        if interactive:
             response = input(f"Earnings date {earnings_date_str} is in the future. Actual earnings data won't be available. Continue? (y/N): ")
             if response.lower() not in ['y', 'yes']:
                 print("Analysis cancelled.")
@@ -171,31 +266,43 @@ Note: Use past earnings dates for best results as actual earnings data is needed
     if args.conservative:
         rate_config = RateLimitConfig(
             guardian_requests_per_minute=8,   # Very conservative
-            groq_requests_per_minute=20,      # Very conservative
-            min_delay_between_requests=2.0,
-            max_delay_between_requests=4.0
+            groq_requests_per_minute=20       # Very conservative
         )
         print("Using conservative rate limits for maximum API safety.")
     else:
         rate_config = RateLimitConfig(
             guardian_requests_per_minute=args.guardian_rate or 12,
-            groq_requests_per_minute=args.groq_rate or 30,
-            min_delay_between_requests=1.0,
-            max_delay_between_requests=2.5
+            groq_requests_per_minute=args.groq_rate or 30
         )
     
+    # Token buckets: bursts up to the per-minute quota, steady state at the quota.
+    # State carries over between runs so back-to-back invocations don't burst into 429s.
+    buckets_path = os.path.join(os.path.expanduser(args.cache_dir), "buckets.json")
+    bucket_state = load_bucket_state(buckets_path)
+    
+    guardian_bucket = TokenBucket(
+        rate_config.guardian_requests_per_minute,
+        rate_config.guardian_requests_per_minute / 60.0,
+        *bucket_state.get("guardian", ())
+    )
+    groq_bucket = TokenBucket(
+        rate_config.groq_requests_per_minute,
+        rate_config.groq_requests_per_minute / 60.0,
+        *bucket_state.get("groq", ())
+    )
+    atexit.register(save_bucket_state, buckets_path, {"guardian": guardian_bucket, "groq": groq_bucket})
+    
     # Display analysis parameters
-    print("\n" + "="*60)
-    print("PRODUCTION CONTRARIAN EARNINGS ANALYSIS")
-    print("="*60)
+    print(HEADER)
     print(f"Company: {args.company}")
     print(f"Symbol: {args.symbol}")
     print(f"Earnings Date: {earnings_date_str}")
     print(f"Search Period: {args.days} days before earnings")
     print(f"Max Articles: {args.max_articles}")
+    print(f"Batch Size: {args.batch_size} articles per Groq request")
     print(f"Rate Limits: Guardian {rate_config.guardian_requests_per_minute}/min, Groq {rate_config.groq_requests_per_minute}/min")
     
-    if not args.force:
+    if interactive:
         response = input("\nProceed with analysis? (Y/n): ")
         if response.lower() in ['n', 'no']:
             print("Analysis cancelled.")
@@ -203,20 +310,45 @@ Note: Use past earnings dates for best results as actual earnings data is needed
     
     print("\nStarting analysis...")
     print("This may take several minutes depending on the number of articles and rate limits.")
-    print("Progress will be logged below:\n")
+    print("Progress is shown below:\n")
     
     try:
+        # Setup response cache
+        cache = ResponseCache(os.path.expanduser(args.cache_dir))
+        if args.clear_cache:
+            cache.clear()
+            print("Response cache cleared.")
+        if args.no_cache:
+            cache = None
+        
         # Initialize analyzer
-        analyzer = ProductionContrarianEarningsAnalyzer(rate_config)
+        analyzer = ProductionContrarianEarningsAnalyzer(rate_config, guardian_bucket, groq_bucket, cache)
+        
+        # Progress bar ticked per classified article, showing remaining limiter tokens;
+        # the analyzer sets the real total once articles are collected
+        pbar = tqdm(total=args.max_articles, disable=args.quiet, desc="Analyzing", unit="article")
+        
+        def on_progress(n, total=None):
+            if total is not None:
+                pbar.total = total
+                pbar.refresh()
+            pbar.set_postfix(guardian_tokens=f"{guardian_bucket.tokens:.1f}", groq_tokens=f"{groq_bucket.tokens:.1f}", refresh=False)
+            pbar.update(n)
         
         # Run analysis
-        report = analyzer.analyze_company_earnings(
-            company_name=args.company,
-            company_symbol=args.symbol,
-            earnings_date=earnings_date_str,
-            days_before=args.days,
-            max_articles=args.max_articles
-        )
+        try:
+            report = asyncio.run(run_analysis(
+                analyzer,
+                company_name=args.company,
+                company_symbol=args.symbol,
+                earnings_date=earnings_date_str,
+                days_before=args.days,
+                max_articles=args.max_articles,
+                batch_size=args.batch_size,
+                progress=on_progress
+            ))
+        finally:
+            pbar.close()
         
         if not report:
             print("\nAnalysis failed. Check the logs above for details.")
@@ -225,7 +357,9 @@ Note: Use past earnings dates for best results as actual earnings data is needed
         # Save report
         filepath = analyzer.save_report(report, args.output)
         
-        # Export to CSV
+        # Export to CSV (exporter dependencies are only imported when there is a report)
+        from analyzers.contrarian_csv_exporter import ContrarianCSVExporter
+        
         print("\nExporting data to CSV files...")
         csv_exporter = ContrarianCSVExporter(create_run_folder=True)
         exported_csv_files = csv_exporter.export_full_analysis(report)
@@ -237,59 +371,53 @@ Note: Use past earnings dates for best results as actual earnings data is needed
         else:
             print("  No CSV files exported (possibly no data)")
         
-        # Display results
-        print("\n" + "="*60)
-        print("ANALYSIS RESULTS")
-        print("="*60)
+        # Display results as a single write
+        lines = []
+        lines.append(RESULTS_HEADER)
         
         # Basic stats
-        print(f"Analysis completed in {report['analysis_parameters']['analysis_duration_seconds']} seconds")
-        print(f"Articles found: {report['data_collection']['total_articles_found']}")
-        print(f"Articles analyzed: {report['data_collection']['articles_analyzed']}")
-        print(f"Successful analyses: {report['data_collection']['successful_analyses']}")
-        print(f"API usage: Guardian {report['api_usage']['guardian_requests']}, Groq {report['api_usage']['groq_requests']}")
+        lines.append(f"Analysis completed in {report['analysis_parameters']['analysis_duration_seconds']} seconds")
+        lines.append(f"Articles found: {report['data_collection']['total_articles_found']}")
+        lines.append(f"Articles analyzed: {report['data_collection']['articles_analyzed']}")
+        lines.append(f"Successful analyses: {report['data_collection']['successful_analyses']}")
+        lines.append(f"API usage: Guardian {report['api_usage']['guardian_requests']}, Groq {report['api_usage']['groq_requests']}")
         
         # Actual results
         if report['actual_result']:
             actual = report['actual_result']
-            print(f"\nACTUAL EARNINGS RESULT:")
-            print(f"  Price change: {actual['price_change_percent']}%")
-            print(f"  Result: {actual['result'].upper()}")
-            print(f"  Volume change: {actual['volume_change_percent']}%")
-            print(f"  Data from: {actual['actual_date_used']}")
+            lines.append(f"\nACTUAL EARNINGS RESULT:")
+            lines.append(f"  Price change: {actual['price_change_percent']}%")
+            lines.append(f"  Result: {actual['result'].upper()}")
+            lines.append(f"  Volume change: {actual['volume_change_percent']}%")
+            lines.append(f"  Data from: {actual['actual_date_used']}")
         else:
-            print(f"\nACTUAL EARNINGS RESULT: Not available")
+            lines.append(f"\nACTUAL EARNINGS RESULT: Not available")
         
         # Contrarian results
-        print(f"\nCONTRARIAN ANALYSIS:")
-        print(f"  Contrarians found: {report['contrarians_found']}")
+        lines.append(f"\nCONTRARIAN ANALYSIS:")
+        lines.append(f"  Contrarians found: {report['contrarians_found']}")
         
         if report['contrarians_found'] > 0:
-            print(f"  Average contrarian score: {report['summary']['avg_contrarian_score']}")
+            lines.append(f"  Average contrarian score: {report['summary']['avg_contrarian_score']}")
             
-            print(f"\nTOP CONTRARIANS:")
+            lines.append(f"\nTOP CONTRARIANS:")
             for i, contrarian in enumerate(report['contrarian_analysts'][:5], 1):
-                print(f"\n  {i}. {contrarian['author']}")
-                print(f"     Score: {contrarian['contrarian_score']}")
-                print(f"     Headline: {contrarian['headline'][:70]}...")
-                print(f"     Sentiment: {contrarian['sentiment']} ({contrarian['sentiment_percentage']}% had this view)")
-                print(f"     Prediction: {contrarian['prediction']} ({contrarian['prediction_percentage']}% had this view)")
-                print(f"     Correct on: Sentiment={contrarian['sentiment_correct']}, Prediction={contrarian['prediction_correct']}")
-                print(f"     Confidence: {contrarian['confidence']} sentiment, {contrarian['prediction_confidence']} prediction")
+                lines.append(CONTRARIAN_TEMPLATE.format(i=i, headline_preview=contrarian['headline'][:70], **contrarian))
         else:
-            print("  No contrarians identified in this analysis.")
-            print("  This could mean:")
-            print("    - The majority view was correct")
-            print("    - No clear minority positions were taken")
-            print("    - Insufficient data for contrarian identification")
+            lines.append("  No contrarians identified in this analysis.")
+            lines.append("  This could mean:")
+            lines.append("    - The majority view was correct")
+            lines.append("    - No clear minority positions were taken")
+            lines.append("    - Insufficient data for contrarian identification")
         
         # Market consensus
-        print(f"\nMARKET CONSENSUS:")
-        print(f"  Sentiment distribution: {report['summary']['sentiment_distribution']}")
-        print(f"  Prediction distribution: {report['summary']['prediction_distribution']}")
+        lines.append(f"\nMARKET CONSENSUS:")
+        lines.append(f"  Sentiment distribution: {report['summary']['sentiment_distribution']}")
+        lines.append(f"  Prediction distribution: {report['summary']['prediction_distribution']}")
         
-        print(f"\nDetailed report saved to: {filepath}")
-        print(f"\nAnalysis complete! 🎯")
+        lines.append(f"\nDetailed report saved to: {filepath}")
+        lines.append(f"\nAnalysis complete! 🎯")
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except KeyboardInterrupt:
         print("\n\nAnalysis interrupted by user.")
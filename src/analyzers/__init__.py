@@ -1,19 +1,31 @@
 # Contrarian Analysis Pipeline - Analyzers Package
 
-# Import main analyzer classes for easier access
-try:
-    from .contrarian_earnings_analyzer_production import ProductionContrarianEarningsAnalyzer, RateLimitConfig
-    from .simplified_contrarian_analyzer import SimplifiedContrarianAnalyzer
-    from .master_contrarian_database import MasterContrarianDatabase
-    from .contrarian_csv_exporter import ContrarianCSVExporter
-except ImportError as e:
-    # Handle import errors gracefully during development
-    print(f"Warning: Could not import some analyzer modules: {e}")
+import importlib
+
+# Main analyzer classes, imported lazily on first access (PEP 562) so that
+# importing the package does not pull in pandas, groq, yfinance, etc.
+_lazy = {
+    'ProductionContrarianEarningsAnalyzer': 'contrarian_earnings_analyzer_production',
+    'RateLimitConfig': 'contrarian_earnings_analyzer_production',
+    'TokenBucket': 'contrarian_earnings_analyzer_production',
+    'ResponseCache': 'contrarian_earnings_analyzer_production',
+    'SimplifiedContrarianAnalyzer': 'simplified_contrarian_analyzer',
+    'MasterContrarianDatabase': 'master_contrarian_database',
+    'ContrarianCSVExporter': 'contrarian_csv_exporter'
+}
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_lazy[name]}", __name__)
+    return getattr(module, name)
 
 __all__ = [
     'ProductionContrarianEarningsAnalyzer',
     'RateLimitConfig', 
+    'TokenBucket',
+    'ResponseCache',
     'SimplifiedContrarianAnalyzer',
     'MasterContrarianDatabase',
     'ContrarianCSVExporter'
-]
\ No newline at end of file
+]
@@ -9,10 +9,210 @@ for further analysis and reporting.
 import csv
 import json
 import os
+import shutil
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional
 from .master_contrarian_database import MasterContrarianDatabase
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Write buffer for export files, so large exports reach the OS in few write() calls
+CSV_BUFFER_SIZE = 1 << 20
+
+# One worker per file written by export_full_analysis
+EXPORT_WORKERS = 5
+
+# ijson prefix of the per-article items in a JSON report
+ARTICLES_PREFIX = 'analyzed_articles.item'
+
+class _StreamedArticles:
+    """Re-iterable view of a report's analyzed_articles, streamed from disk on every pass"""
+    
+    def __init__(self, json_filepath: str, count: int):
+        self.json_filepath = json_filepath
+        self.count = count
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __iter__(self) -> Iterator[Dict]:
+        # Each pass opens its own handle, so concurrent exporters can share the view
+        with open(self.json_filepath, 'rb') as f:
+            yield from ijson.items(f, ARTICLES_PREFIX, use_float=True)
+
+def _stream_report(json_filepath: str) -> Dict:
+    """Build every report section except analyzed_articles, which is left on disk and streamed"""
+    builders = {}
+    article_count = None
+    
+    with open(json_filepath, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            key = prefix.split('.', 1)[0]
+            if key == 'analyzed_articles':
+                if prefix == 'analyzed_articles' and event == 'start_array':
+                    article_count = 0
+                elif prefix == ARTICLES_PREFIX and event not in ('map_key', 'end_map', 'end_array'):
+                    article_count += 1
+            elif key:
+                if key not in builders:
+                    builders[key] = ijson.ObjectBuilder()
+                builders[key].event(event, value)
+    
+    report_data = {key: builder.value for key, builder in builders.items()}
+    if article_count is not None:
+        report_data['analyzed_articles'] = _StreamedArticles(json_filepath, article_count)
+    return report_data
+
+class _Utf8Sink:
+    """File-like adapter that encodes the csv writer's rows straight into a binary file"""
+    
+    def __init__(self, fp):
+        self.fp = fp
+    
+    def write(self, s: str) -> int:
+        return self.fp.write(s.encode('utf-8'))
+
+@contextmanager
+def _open_csv_writer(filepath: str, headers: List[str]):
+    """Open a buffered CSV file for writing and yield a writer with the header row written"""
+    with open(filepath, 'wb', buffering=CSV_BUFFER_SIZE) as csvfile:
+        # Numeric columns are ints/floats or plain "%.1f" strings, so minimal
+        # quoting leaves them bare
+        writer = csv.writer(_Utf8Sink(csvfile), quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(headers)
+        yield writer
+
+# Row builders: each returns one export row as a tuple in header order
+
+def _build_article_row(article: Dict, company: str, symbol: str,
+                       earnings_date: str, analysis_date: str) -> tuple:
+    """Row of export_articles_analysis for one article"""
+    analysis = article.get('analysis') or {}
+    
+    # Handle key concerns (convert list to string)
+    key_concerns = analysis.get('key_concerns') or ()
+    key_concerns_str = '; '.join(key_concerns) if isinstance(key_concerns, (list, tuple)) else str(key_concerns)
+    
+    # Row values in header order
+    return (
+        company,
+        symbol,
+        earnings_date,
+        article.get('date', ''),
+        article.get('author', 'Unknown'),
+        article.get('headline', ''),
+        article.get('section', ''),
+        article.get('word_count', 0),
+        article.get('url', ''),
+        analysis.get('sentiment', 'N/A'),
+        analysis.get('confidence', 'N/A'),
+        analysis.get('earnings_prediction', 'N/A'),
+        analysis.get('prediction_confidence', 'N/A'),
+        key_concerns_str,
+        analysis.get('reasoning', ''),
+        'Yes' if analysis else 'No',
+        analysis_date
+    )
+
+def _build_contrarian_row(rank: int, contrarian: Dict, company: str,
+                          symbol: str, earnings_date: str) -> tuple:
+    """Row of export_contrarians_summary for one ranked contrarian"""
+    # Row values in header order
+    return (
+        company,
+        symbol,
+        earnings_date,
+        rank,
+        contrarian.get('author', 'Unknown'),
+        contrarian.get('headline', ''),
+        contrarian.get('date', ''),
+        contrarian.get('sentiment', ''),
+        contrarian.get('prediction', ''),
+        contrarian.get('sentiment_percentage', 0),
+        contrarian.get('prediction_percentage', 0),
+        contrarian.get('was_minority_sentiment', False),
+        contrarian.get('was_minority_prediction', False),
+        contrarian.get('sentiment_correct', False),
+        contrarian.get('prediction_correct', False),
+        contrarian.get('contrarian_score', 0),
+        contrarian.get('confidence', ''),
+        contrarian.get('prediction_confidence', ''),
+        contrarian.get('reasoning', ''),
+        contrarian.get('url', '')
+    )
+
+def _build_article_summary_row(article: Dict, company: str, symbol: str,
+                               earnings_date: str, analysis_date: str) -> tuple:
+    """Row of export_articles_summary for one article"""
+    analysis = article.get('analysis') or {}
+    
+    # Row values in header order
+    return (
+        company,
+        symbol,
+        earnings_date,
+        article.get('date', ''),
+        article.get('author', 'Unknown'),
+        article.get('headline', ''),
+        article.get('url', ''),
+        analysis.get('sentiment', 'N/A'),
+        analysis.get('earnings_prediction', 'N/A'),
+        analysis_date
+    )
+
+def _build_author_tracker_row(author: str, stats: Dict, company: str, symbol: str,
+                              earnings_date: str, analysis_date: str) -> tuple:
+    """Row of export_author_contrarian_tracker for one author's aggregated stats"""
+    # Calculate rates
+    sentiment_rate = (stats['contrarian_sentiment_count'] / stats['total_articles'] * 100) if stats['total_articles'] > 0 else 0
+    prediction_rate = (stats['contrarian_prediction_count'] / stats['total_articles'] * 100) if stats['total_articles'] > 0 else 0
+    overall_rate = ((stats['contrarian_sentiment_count'] + stats['contrarian_prediction_count']) / (stats['total_articles'] * 2) * 100) if stats['total_articles'] > 0 else 0
+    
+    # Find dominant sentiment and prediction
+    dominant_sentiment = stats['sentiment_breakdown'].most_common(1)[0][0] if stats['sentiment_breakdown'] else 'N/A'
+    dominant_prediction = stats['prediction_breakdown'].most_common(1)[0][0] if stats['prediction_breakdown'] else 'N/A'
+    
+    # Calculate diversity score (how varied their opinions are)
+    sentiment_diversity = len(stats['sentiment_breakdown'])
+    prediction_diversity = len(stats['prediction_breakdown'])
+    diversity_score = (sentiment_diversity + prediction_diversity) / 2
+    
+    # Row values in header order
+    return (
+        company,
+        symbol,
+        earnings_date,
+        author,
+        stats['total_articles'],
+        stats['contrarian_sentiment_count'],
+        stats['contrarian_prediction_count'],
+        f"{sentiment_rate:.1f}",
+        f"{prediction_rate:.1f}",
+        f"{overall_rate:.1f}",
+        stats['is_identified_contrarian'],
+        stats['contrarian_rank'] or '',
+        stats['contrarian_score'],
+        dominant_sentiment,
+        dominant_prediction,
+        f"{diversity_score:.1f}",
+        *stats['latest_article'],
+        analysis_date
+    )
+
 class ContrarianCSVExporter:
     """
     Exports contrarian analysis data to CSV format for easy monitoring and analysis
@@ -33,6 +233,7 @@ class ContrarianCSVExporter:
             
         self.create_run_folder = create_run_folder
         self.run_folder = None
+        self._run_folder_lock = threading.Lock()
         os.makedirs(self.output_dir, exist_ok=True)
         
         # Initialize master contrarian database
@@ -45,24 +246,25 @@ class ContrarianCSVExporter:
         if not self.create_run_folder:
             return self.base_output_dir
             
-        if self.run_folder is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.run_folder = os.path.join(self.base_output_dir, f"{symbol}_{timestamp}")
-            os.makedirs(self.run_folder, exist_ok=True)
-            print(f"Created analysis run folder: {self.run_folder}")
+        # Exports may run concurrently; only the first one creates the folder
+        with self._run_folder_lock:
+            if self.run_folder is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                self.run_folder = os.path.join(self.base_output_dir, f"{symbol}_{timestamp}")
+                os.makedirs(self.run_folder, exist_ok=True)
+                print(f"Created analysis run folder: {self.run_folder}")
         
         return self.run_folder
     
-    def export_articles_analysis(self, analyzed_articles: List[Dict], 
+    def export_articles_analysis(self, analyzed_articles: Iterable[Dict], 
                                company: str, symbol: str, 
-                               earnings_date: str) -> str:
+                               earnings_date: str, timestamp: str = None) -> str:
         """
         Export analyzed articles to CSV with detailed information
         """
         output_dir = self._get_run_folder(symbol)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"articles_analysis_{symbol}_{timestamp}.csv"
-        filepath = os.path.join(output_dir, filename)
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = f"{output_dir}{os.sep}articles_analysis_{symbol}_{timestamp}.csv"
         
         # Define CSV headers
         headers = [
@@ -85,41 +287,11 @@ class ContrarianCSVExporter:
             'Analysis_Date'
         ]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            
-            for article in analyzed_articles:
-                analysis = article.get('analysis') or {}
-                
-                # Handle key concerns (convert list to string)
-                key_concerns = analysis.get('key_concerns', [])
-                if isinstance(key_concerns, list):
-                    key_concerns_str = '; '.join(key_concerns)
-                else:
-                    key_concerns_str = str(key_concerns) if key_concerns else ''
-                
-                row = {
-                    'Company': company,
-                    'Symbol': symbol,
-                    'Earnings_Date': earnings_date,
-                    'Article_Date': article.get('date', ''),
-                    'Author': article.get('author', 'Unknown'),
-                    'Headline': article.get('headline', ''),
-                    'Section': article.get('section', ''),
-                    'Word_Count': article.get('word_count', 0),
-                    'URL': article.get('url', ''),
-                    'Sentiment': analysis.get('sentiment', 'N/A'),
-                    'Sentiment_Confidence': analysis.get('confidence', 'N/A'),
-                    'Earnings_Prediction': analysis.get('earnings_prediction', 'N/A'),
-                    'Prediction_Confidence': analysis.get('prediction_confidence', 'N/A'),
-                    'Key_Concerns': key_concerns_str,
-                    'Reasoning': analysis.get('reasoning', ''),
-                    'Analysis_Success': 'Yes' if analysis else 'No',
-                    'Analysis_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                writer.writerow(row)
+        with _open_csv_writer(filepath, headers) as writer:
+            analysis_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            # Rows are written as the articles stream in, never held in memory
+            writer.writerows(_build_article_row(article, company, symbol, earnings_date, analysis_date)
+                             for article in analyzed_articles)
         
         print(f"Articles analysis exported to: {filepath}")
         return filepath
@@ -127,14 +299,13 @@ class ContrarianCSVExporter:
     def export_contrarians_summary(self, contrarians: List[Dict], 
                                  sentiment_dist: Dict, prediction_dist: Dict,
                                  company: str, symbol: str, 
-                                 earnings_date: str, actual_result: Dict = None) -> str:
+                                 earnings_date: str, actual_result: Dict = None, timestamp: str = None) -> str:
         """
         Export contrarian analysts summary to CSV
         """
         output_dir = self._get_run_folder(symbol)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"contrarians_summary_{symbol}_{timestamp}.csv"
-        filepath = os.path.join(output_dir, filename)
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = f"{output_dir}{os.sep}contrarians_summary_{symbol}_{timestamp}.csv"
         
         headers = [
             'Company',
@@ -159,49 +330,24 @@ class ContrarianCSVExporter:
             'URL'
         ]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
+        with _open_csv_writer(filepath, headers) as writer:
+            rows = [_build_contrarian_row(i, contrarian, company, symbol, earnings_date)
+                    for i, contrarian in enumerate(contrarians, 1)]
             
-            for i, contrarian in enumerate(contrarians, 1):
-                row = {
-                    'Company': company,
-                    'Symbol': symbol,
-                    'Earnings_Date': earnings_date,
-                    'Rank': i,
-                    'Author': contrarian.get('author', 'Unknown'),
-                    'Headline': contrarian.get('headline', ''),
-                    'Article_Date': contrarian.get('date', ''),
-                    'Sentiment': contrarian.get('sentiment', ''),
-                    'Prediction': contrarian.get('prediction', ''),
-                    'Sentiment_Percentage': contrarian.get('sentiment_percentage', 0),
-                    'Prediction_Percentage': contrarian.get('prediction_percentage', 0),
-                    'Was_Minority_Sentiment': contrarian.get('was_minority_sentiment', False),
-                    'Was_Minority_Prediction': contrarian.get('was_minority_prediction', False),
-                    'Sentiment_Correct': contrarian.get('sentiment_correct', False),
-                    'Prediction_Correct': contrarian.get('prediction_correct', False),
-                    'Contrarian_Score': contrarian.get('contrarian_score', 0),
-                    'Confidence': contrarian.get('confidence', ''),
-                    'Prediction_Confidence': contrarian.get('prediction_confidence', ''),
-                    'Reasoning': contrarian.get('reasoning', ''),
-                    'URL': contrarian.get('url', '')
-                }
-                
-                writer.writerow(row)
+            writer.writerows(rows)
         
         print(f"Contrarians summary exported to: {filepath}")
         return filepath
     
     def export_market_consensus(self, sentiment_dist: Dict, prediction_dist: Dict,
                               company: str, symbol: str, earnings_date: str,
-                              total_articles: int, actual_result: Dict = None) -> str:
+                              total_articles: int, actual_result: Dict = None, timestamp: str = None) -> str:
         """
         Export market consensus data to CSV
         """
         output_dir = self._get_run_folder(symbol)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"market_consensus_{symbol}_{timestamp}.csv"
-        filepath = os.path.join(output_dir, filename)
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = f"{output_dir}{os.sep}market_consensus_{symbol}_{timestamp}.csv"
         
         headers = [
             'Company',
@@ -216,61 +362,58 @@ class ContrarianCSVExporter:
             'Is_Majority'
         ]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            
+        with _open_csv_writer(filepath, headers) as writer:
             analysis_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            rows = []
             
             # Export sentiment distribution
             max_sentiment_count = max(sentiment_dist.values()) if sentiment_dist else 0
             for sentiment, count in sentiment_dist.items():
                 percentage = (count / total_articles * 100) if total_articles > 0 else 0
-                row = {
-                    'Company': company,
-                    'Symbol': symbol,
-                    'Earnings_Date': earnings_date,
-                    'Analysis_Date': analysis_date,
-                    'Total_Articles': total_articles,
-                    'Metric_Type': 'Sentiment',
-                    'Category': sentiment,
-                    'Count': count,
-                    'Percentage': round(percentage, 1),
-                    'Is_Majority': count == max_sentiment_count
-                }
-                writer.writerow(row)
+                rows.append((
+                    company,
+                    symbol,
+                    earnings_date,
+                    analysis_date,
+                    total_articles,
+                    'Sentiment',
+                    sentiment,
+                    count,
+                    f"{percentage:.1f}",
+                    count == max_sentiment_count
+                ))
             
             # Export prediction distribution
             max_prediction_count = max(prediction_dist.values()) if prediction_dist else 0
             for prediction, count in prediction_dist.items():
                 percentage = (count / total_articles * 100) if total_articles > 0 else 0
-                row = {
-                    'Company': company,
-                    'Symbol': symbol,
-                    'Earnings_Date': earnings_date,
-                    'Analysis_Date': analysis_date,
-                    'Total_Articles': total_articles,
-                    'Metric_Type': 'Prediction',
-                    'Category': prediction,
-                    'Count': count,
-                    'Percentage': round(percentage, 1),
-                    'Is_Majority': count == max_prediction_count
-                }
-                writer.writerow(row)
+                rows.append((
+                    company,
+                    symbol,
+                    earnings_date,
+                    analysis_date,
+                    total_articles,
+                    'Prediction',
+                    prediction,
+                    count,
+                    f"{percentage:.1f}",
+                    count == max_prediction_count
+                ))
+            
+            writer.writerows(rows)
         
         print(f"Market consensus exported to: {filepath}")
         return filepath
     
-    def export_articles_summary(self, analyzed_articles: List[Dict], 
+    def export_articles_summary(self, analyzed_articles: Iterable[Dict], 
                               company: str, symbol: str, 
-                              earnings_date: str) -> str:
+                              earnings_date: str, timestamp: str = None) -> str:
         """
         Export a simplified articles summary with title, author, and link
         """
         output_dir = self._get_run_folder(symbol)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"articles_summary_{symbol}_{timestamp}.csv"
-        filepath = os.path.join(output_dir, filename)
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = f"{output_dir}{os.sep}articles_summary_{symbol}_{timestamp}.csv"
         
         headers = [
             'Company',
@@ -285,43 +428,26 @@ class ContrarianCSVExporter:
             'Analysis_Date'
         ]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            
-            for article in analyzed_articles:
-                analysis = article.get('analysis') or {}
-                
-                row = {
-                    'Company': company,
-                    'Symbol': symbol,
-                    'Earnings_Date': earnings_date,
-                    'Article_Date': article.get('date', ''),
-                    'Author': article.get('author', 'Unknown'),
-                    'Article_Title': article.get('headline', ''),
-                    'Article_URL': article.get('url', ''),
-                    'Sentiment': analysis.get('sentiment', 'N/A'),
-                    'Earnings_Prediction': analysis.get('earnings_prediction', 'N/A'),
-                    'Analysis_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                writer.writerow(row)
+        with _open_csv_writer(filepath, headers) as writer:
+            analysis_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            # Rows are written as the articles stream in, never held in memory
+            writer.writerows(_build_article_summary_row(article, company, symbol, earnings_date, analysis_date)
+                             for article in analyzed_articles)
         
         print(f"Articles summary exported to: {filepath}")
         return filepath
     
-    def export_author_contrarian_tracker(self, analyzed_articles: List[Dict], 
+    def export_author_contrarian_tracker(self, analyzed_articles: Iterable[Dict], 
                                         contrarians: List[Dict],
                                         sentiment_dist: Dict, prediction_dist: Dict,
                                         company: str, symbol: str, 
-                                        earnings_date: str) -> str:
+                                        earnings_date: str, timestamp: str = None) -> str:
         """
         Export author-focused contrarian detection data to CSV for easier tracking
         """
         output_dir = self._get_run_folder(symbol)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"author_contrarian_tracker_{symbol}_{timestamp}.csv"
-        filepath = os.path.join(output_dir, filename)
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = f"{output_dir}{os.sep}author_contrarian_tracker_{symbol}_{timestamp}.csv"
         
         # Calculate author statistics
         author_stats = {}
@@ -330,53 +456,50 @@ class ContrarianCSVExporter:
         majority_sentiment = max(sentiment_dist, key=sentiment_dist.get) if sentiment_dist else None
         majority_prediction = max(prediction_dist, key=prediction_dist.get) if prediction_dist else None
         
+        # Values that never count as contrarian
+        non_contrarian_sentiments = (majority_sentiment, 'N/A')
+        non_contrarian_predictions = (majority_prediction, 'N/A')
+        
         # Process all analyzed articles
         for article in analyzed_articles:
-            author = article.get('author', 'Unknown')
-            analysis = article.get('analysis') or {}
-            sentiment = analysis.get('sentiment', 'N/A')
-            prediction = analysis.get('earnings_prediction', 'N/A')
+            # Bound lookups reused for every field of this article
+            article_get = article.get
+            author = article_get('author', 'Unknown')
+            analysis_get = (article_get('analysis') or {}).get
+            sentiment = analysis_get('sentiment', 'N/A')
+            prediction = analysis_get('earnings_prediction', 'N/A')
             
-            if author not in author_stats:
-                author_stats[author] = {
+            stats = author_stats.get(author)
+            if stats is None:
+                stats = author_stats[author] = {
                     'total_articles': 0,
                     'contrarian_sentiment_count': 0,
                     'contrarian_prediction_count': 0,
-                    'sentiment_breakdown': {},
-                    'prediction_breakdown': {},
+                    'sentiment_breakdown': Counter(),
+                    'prediction_breakdown': Counter(),
                     'is_identified_contrarian': False,
                     'contrarian_rank': None,
                     'contrarian_score': 0,
-                    'latest_article_date': '',
-                    'latest_headline': '',
-                    'latest_url': ''
+                    # (date, headline, url) of the author's most recent article
+                    'latest_article': ('', '', '')
                 }
             
-            stats = author_stats[author]
             stats['total_articles'] += 1
             
-            # Track sentiment breakdown
-            if sentiment not in stats['sentiment_breakdown']:
-                stats['sentiment_breakdown'][sentiment] = 0
+            # Track sentiment and prediction breakdowns
             stats['sentiment_breakdown'][sentiment] += 1
-            
-            # Track prediction breakdown
-            if prediction not in stats['prediction_breakdown']:
-                stats['prediction_breakdown'][prediction] = 0
             stats['prediction_breakdown'][prediction] += 1
             
             # Check if contrarian
-            if sentiment != majority_sentiment and sentiment != 'N/A':
+            if sentiment not in non_contrarian_sentiments:
                 stats['contrarian_sentiment_count'] += 1
-            if prediction != majority_prediction and prediction != 'N/A':
+            if prediction not in non_contrarian_predictions:
                 stats['contrarian_prediction_count'] += 1
             
             # Update latest article info
-            article_date = article.get('date', '')
-            if article_date > stats['latest_article_date']:
-                stats['latest_article_date'] = article_date
-                stats['latest_headline'] = article.get('headline', '')
-                stats['latest_url'] = article.get('url', '')
+            article_date = article_get('date', '')
+            if article_date > stats['latest_article'][0]:
+                stats['latest_article'] = (article_date, article_get('headline', ''), article_get('url', ''))
         
         # Mark identified contrarians
         if contrarians:
@@ -411,49 +534,12 @@ class ContrarianCSVExporter:
             'Analysis_Date'
         ]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
+        with _open_csv_writer(filepath, headers) as writer:
+            analysis_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            rows = [_build_author_tracker_row(author, stats, company, symbol, earnings_date, analysis_date)
+                    for author, stats in author_stats.items()]
             
-            for author, stats in author_stats.items():
-                # Calculate rates
-                sentiment_rate = (stats['contrarian_sentiment_count'] / stats['total_articles'] * 100) if stats['total_articles'] > 0 else 0
-                prediction_rate = (stats['contrarian_prediction_count'] / stats['total_articles'] * 100) if stats['total_articles'] > 0 else 0
-                overall_rate = ((stats['contrarian_sentiment_count'] + stats['contrarian_prediction_count']) / (stats['total_articles'] * 2) * 100) if stats['total_articles'] > 0 else 0
-                
-                # Find dominant sentiment and prediction
-                dominant_sentiment = max(stats['sentiment_breakdown'], key=stats['sentiment_breakdown'].get) if stats['sentiment_breakdown'] else 'N/A'
-                dominant_prediction = max(stats['prediction_breakdown'], key=stats['prediction_breakdown'].get) if stats['prediction_breakdown'] else 'N/A'
-                
-                # Calculate diversity score (how varied their opinions are)
-                sentiment_diversity = len(stats['sentiment_breakdown'])
-                prediction_diversity = len(stats['prediction_breakdown'])
-                diversity_score = (sentiment_diversity + prediction_diversity) / 2
-                
-                row = {
-                    'Company': company,
-                    'Symbol': symbol,
-                    'Earnings_Date': earnings_date,
-                    'Author': author,
-                    'Total_Articles': stats['total_articles'],
-                    'Contrarian_Sentiment_Count': stats['contrarian_sentiment_count'],
-                    'Contrarian_Prediction_Count': stats['contrarian_prediction_count'],
-                    'Contrarian_Sentiment_Rate': round(sentiment_rate, 1),
-                    'Contrarian_Prediction_Rate': round(prediction_rate, 1),
-                    'Overall_Contrarian_Rate': round(overall_rate, 1),
-                    'Is_Identified_Contrarian': stats['is_identified_contrarian'],
-                    'Contrarian_Rank': stats['contrarian_rank'] or '',
-                    'Contrarian_Score': stats['contrarian_score'],
-                    'Dominant_Sentiment': dominant_sentiment,
-                    'Dominant_Prediction': dominant_prediction,
-                    'Sentiment_Diversity_Score': round(diversity_score, 1),
-                    'Latest_Article_Date': stats['latest_article_date'],
-                    'Latest_Headline': stats['latest_headline'],
-                    'Latest_URL': stats['latest_url'],
-                    'Analysis_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                writer.writerow(row)
+            writer.writerows(rows)
         
         print(f"Author contrarian tracker exported to: {filepath}")
         return filepath
@@ -478,18 +564,52 @@ class ContrarianCSVExporter:
         Get statistics from the master contrarian database
         """
         try:
-            import pandas as pd
-            
             if os.path.exists(self.master_db.master_csv_path):
-                df = pd.read_csv(self.master_db.master_csv_path)
+                # Single streaming pass over the master CSV, keeping only running aggregates
+                with open(self.master_db.master_csv_path, newline='', encoding='utf-8') as f:
+                    reader = csv.reader(f)
+                    headers = next(reader, [])
+                    idx_name = headers.index('Author_Name')
+                    idx_inst = headers.index('Total_Contrarian_Instances')
+                    idx_rate = headers.index('Contrarian_Success_Rate')
+                    
+                    total_authors = 0
+                    total_instances = 0
+                    repeat_contrarians = 0
+                    rate_sum = 0.0
+                    rate_count = 0
+                    max_inst = max_rate = None
+                    most_active = top_performer = None
+                    
+                    for row in reader:
+                        total_authors += 1
+                        
+                        inst_value = row[idx_inst]
+                        instances = int(float(inst_value)) if inst_value else 0
+                        total_instances += instances
+                        if instances > 1:
+                            repeat_contrarians += 1
+                        if max_inst is None or instances > max_inst:
+                            max_inst = instances
+                            most_active = row[idx_name]
+                        
+                        # Authors without a resolved call have no success rate yet
+                        rate_value = row[idx_rate]
+                        if rate_value:
+                            rate = float(rate_value)
+                            rate_sum += rate
+                            rate_count += 1
+                            if max_rate is None or rate > max_rate:
+                                max_rate = rate
+                                top_performer = row[idx_name]
                 
                 stats = {
-                    'total_authors': len(df),
-                    'total_contrarian_instances': df['Total_Contrarian_Instances'].sum(),
-                    'repeat_contrarians': len(df[df['Total_Contrarian_Instances'] > 1]),
-                    'avg_success_rate': df['Contrarian_Success_Rate'].mean(),
-                    'top_performer': df.loc[df['Contrarian_Success_Rate'].idxmax(), 'Author_Name'] if not df.empty else None,
-                    'most_active': df.loc[df['Total_Contrarian_Instances'].idxmax(), 'Author_Name'] if not df.empty else None
+                    'total_authors': total_authors,
+                    'total_contrarian_instances': total_instances,
+                    'repeat_contrarians': repeat_contrarians,
+                    'avg_success_rate': rate_sum / rate_count if rate_count else float('nan'),
+                    'top_performer': top_performer,
+                    'most_active': most_active
                 }
                 
                 return stats
@@ -509,12 +629,9 @@ class ContrarianCSVExporter:
         csv_path = os.path.join(output_folder, f'master_database_summary_{timestamp}.csv')
         
         try:
-            import pandas as pd
-            
             if os.path.exists(self.master_db.master_csv_path):
                 # Copy the master database to the output folder
-                df = pd.read_csv(self.master_db.master_csv_path)
-                df.to_csv(csv_path, index=False)
+                shutil.copyfile(self.master_db.master_csv_path, csv_path)
                 
                 print(f"Master database summary exported: {csv_path}")
                 return csv_path
@@ -543,35 +660,47 @@ class ContrarianCSVExporter:
         data_collection = report_data.get('data_collection') or {}
         total_articles = data_collection.get('articles_analyzed', 0)
         
-        exported_files = {}
-        
-        # Export articles analysis
-        if analyzed_articles:
-            exported_files['articles'] = self.export_articles_analysis(
-                analyzed_articles, company, symbol, earnings_date
-            )
-            # Export simplified articles summary
-            exported_files['articles_summary'] = self.export_articles_summary(
-                analyzed_articles, company, symbol, earnings_date
-            )
-            # Export author contrarian tracker
-            exported_files['author_tracker'] = self.export_author_contrarian_tracker(
-                analyzed_articles, contrarians, sentiment_dist, prediction_dist,
-                company, symbol, earnings_date
-            )
+        # One timestamp shared by every file of this run
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Export contrarians summary
-        if contrarians:
-            exported_files['contrarians'] = self.export_contrarians_summary(
-                contrarians, sentiment_dist, prediction_dist, 
-                company, symbol, earnings_date, actual_result
+        # The exports write independent files, so run them concurrently
+        with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+            futures = {}
+            
+            # Export articles analysis
+            if analyzed_articles:
+                futures['articles'] = executor.submit(
+                    self.export_articles_analysis,
+                    analyzed_articles, company, symbol, earnings_date, timestamp
+                )
+                # Export simplified articles summary
+                futures['articles_summary'] = executor.submit(
+                    self.export_articles_summary,
+                    analyzed_articles, company, symbol, earnings_date, timestamp
+                )
+                # Export author contrarian tracker
+                futures['author_tracker'] = executor.submit(
+                    self.export_author_contrarian_tracker,
+                    analyzed_articles, contrarians, sentiment_dist, prediction_dist,
+                    company, symbol, earnings_date, timestamp
+                )
+            
+            # Export contrarians summary
+            if contrarians:
+                futures['contrarians'] = executor.submit(
+                    self.export_contrarians_summary,
+                    contrarians, sentiment_dist, prediction_dist, 
+                    company, symbol, earnings_date, actual_result, timestamp
+                )
+            
+            # Export market consensus
+            futures['consensus'] = executor.submit(
+                self.export_market_consensus,
+                sentiment_dist, prediction_dist, company, symbol, 
+                earnings_date, total_articles, actual_result, timestamp
             )
-        
-        # Export market consensus
-        exported_files['consensus'] = self.export_market_consensus(
-            sentiment_dist, prediction_dist, company, symbol, 
-            earnings_date, total_articles, actual_result
-        )
+            
+            exported_files = {name: future.result() for name, future in futures.items()}
         
         # Update master contrarian database
         self.update_master_contrarian_database(report_data)
@@ -583,8 +712,12 @@ class ContrarianCSVExporter:
         Load a JSON report and export to CSV files
         """
         try:
-            with open(json_filepath, 'r') as f:
-                report_data = json.load(f)
+            if IJSON_AVAILABLE:
+                report_data = _stream_report(json_filepath)
+            else:
+                with open(json_filepath, 'rb') as f:
+                    raw = f.read()
+                report_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
             print(f"Loading report from: {json_filepath}")
             return self.export_full_analysis(report_data)
@@ -606,7 +739,9 @@ def main():
     reports_dir = os.path.join(project_root, "outputs")
     
     if os.path.exists(reports_dir):
-        json_files = [f for f in os.listdir(reports_dir) if f.endswith('.json') and 'contrarian' in f]
+        with os.scandir(reports_dir) as entries:
+            json_files = [e.name for e in entries
+                          if e.name.endswith('.json') and 'contrarian' in e.name and e.is_file()]
         
         print(f"Found {len(json_files)} contrarian JSON reports to convert:")
         
@@ -13,85 +13,190 @@ Workflow:
 5. Identify contrarian voices who were minority but correct
 """
 
-import requests
-import pandas as pd
+import httpx
 import json
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import os
-from collections import defaultdict, Counter
-import yfinance as yf
-from groq import Groq
 import logging
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .json_utils import json_default
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+GUARDIAN_SEARCH_URL = "https://content.guardianapis.com/search"
+MAX_SEARCH_PAGES = 5
+MAX_BODY_CHARS = 2000  # Article text sent to the LLM
+MAX_RATE_LIMIT_RETRIES = 3
+ANALYSIS_WORKERS = 8
+EARNINGS_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+SYSTEM_PROMPT = "You are a financial analyst expert at analyzing earnings predictions and sentiment in financial articles."
+
+# JSON object the LLM returns for each article
+ANALYSIS_SCHEMA = """{
+            "sentiment": "bullish/bearish/neutral",
+            "confidence": "high/medium/low",
+            "earnings_prediction": "beat/miss/meet/unclear",
+            "specific_predictions": ["list of specific predictions made"],
+            "reasoning": "brief explanation of the analysis",
+            "key_concerns": ["main concerns or positive points mentioned"],
+            "prediction_confidence": "how confident the author seems about their prediction"
+        }"""
+
+# Single-article prompt; built once, only the article fields are substituted per call
+ARTICLE_PROMPT_TEMPLATE = string.Template("""
+        Analyze this financial article about earnings expectations:
+        
+        Headline: $headline
+        Author: $author
+        Content: $body...
+        
+        Please provide analysis in JSON format:
+        """ + ANALYSIS_SCHEMA + """
+        
+        Focus on:
+        - Overall tone about company prospects
+        - Specific earnings predictions or expectations
+        - Revenue/profit forecasts
+        - Any contrarian viewpoints expressed
+        """)
+
+# Decodes the JSON embedded in LLM responses without slicing it out first
+_JSON_DECODER = json.JSONDecoder()
+
+def _as_datetime(date):
+    """Accept an earnings date as a YYYY-MM-DD string or an already-parsed datetime"""
+    return date if isinstance(date, datetime) else datetime.fromisoformat(date)
+
 class ContrarianEarningsAnalyzer:
     def __init__(self):
         load_dotenv()
         self.guardian_api_key = os.getenv("GUARDIAN_API_KEY")
         self.groq_api_key = os.getenv("GROQ_API_KEY")
-        self.groq_client = Groq(api_key=self.groq_api_key)
         
+        # One pooled client for Guardian and Groq; with HTTP/2 the concurrent
+        # requests to each host are multiplexed over a single connection
+        self._http = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            timeout=30.0
+        )
+        from groq import Groq
+        self.groq_client = Groq(api_key=self.groq_api_key, http_client=self._http)
+        
+        # On-disk cache of actual earnings results, shared across runs
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(os.path.dirname(current_dir))
+        self.earnings_cache_dir = os.path.join(project_root, "reports", ".cache")
+        
+        # In-process earnings results keyed on (symbol, date); failures are not stored
+        self._earnings_results = {}
+        
+    def _fetch_search_page(self, params, page):
+        """
+        Fetch one Guardian search page, returning its 'response' body or None on failure
+        """
+        response = self._http.get(GUARDIAN_SEARCH_URL, params={**params, "page": page})
+        
+        if response.status_code != 200:
+            logger.error(f"API request failed: {response.status_code}")
+            return None
+            
+        data = response.json()
+        
+        if 'response' not in data or 'results' not in data['response']:
+            logger.error("Unexpected API response structure")
+            return None
+        
+        return data['response']
+    
     def collect_pre_earnings_articles(self, company_name, earnings_date, days_before=30):
         """
         Collect articles about the company published before earnings date
         """
-        logger.info(f"Collecting articles for {company_name} before {earnings_date}")
+        earnings_dt = _as_datetime(earnings_date)
+        logger.info(f"Collecting articles for {company_name} before {earnings_dt:%Y-%m-%d}")
         
         # Calculate date range
-        earnings_dt = datetime.strptime(earnings_date, "%Y-%m-%d")
         start_date = earnings_dt - timedelta(days=days_before)
         end_date = earnings_dt - timedelta(days=1)  # Day before earnings
         
         # Search Guardian API
+        params = {
+            "api-key": self.guardian_api_key,
+            "q": company_name,
+            "from-date": start_date.strftime("%Y-%m-%d"),
+            "to-date": end_date.strftime("%Y-%m-%d"),
+            "page-size": 50,
+            "show-fields": "headline,bodyText,byline,firstPublicationDate,shortUrl,trailText",
+            "order-by": "newest"
+        }
+        
+        # Page 1 tells us how many pages exist; the rest are fetched concurrently
+        search_pages = [self._fetch_search_page(params, 1)]
+        if search_pages[0] is not None:
+            last_page = min(MAX_SEARCH_PAGES, search_pages[0].get('pages', 1))
+            if last_page > 1:
+                with ThreadPoolExecutor(max_workers=MAX_SEARCH_PAGES) as executor:
+                    search_pages.extend(executor.map(
+                        lambda page: self._fetch_search_page(params, page),
+                        range(2, last_page + 1)
+                    ))
+        
         articles = []
-        page = 1
-        
-        while page <= 5:  # Limit to 5 pages
-            response = requests.get("https://content.guardianapis.com/search", params={
-                "api-key": self.guardian_api_key,
-                "q": company_name,
-                "from-date": start_date.strftime("%Y-%m-%d"),
-                "to-date": end_date.strftime("%Y-%m-%d"),
-                "page-size": 50,
-                "page": page,
-                "show-fields": "all",
-                "order-by": "newest"
-            })
-            
-            if response.status_code != 200:
-                logger.error(f"API request failed: {response.status_code}")
-                break
-                
-            data = response.json()
-            
-            if 'response' not in data or 'results' not in data['response']:
-                logger.error("Unexpected API response structure")
-                break
-                
-            results = data['response']['results']
-            if not results:
+        
+        # Merge in page order, stopping at the first failed or empty page
+        for search_page in search_pages:
+            if search_page is None or not search_page['results']:
                 break
                 
-            for article in results:
+            for article in search_page['results']:
                 if 'fields' in article:
                     articles.append({
                         'headline': article['fields'].get('headline', ''),
-                        'body': article['fields'].get('bodyText', ''),
+                        'body': article['fields'].get('bodyText', '')[:MAX_BODY_CHARS],
                         'author': article['fields'].get('byline', 'Unknown'),
                         'date': article['fields'].get('firstPublicationDate', ''),
                         'url': article['fields'].get('shortUrl', ''),
                         'trail_text': article['fields'].get('trailText', '')
                     })
             
-            page += 1
-            
         logger.info(f"Collected {len(articles)} articles")
         return articles
     
+    def _groq_completion(self, **kwargs):
+        """
+        Groq chat completion, retrying rate-limited requests with exponential backoff
+        """
+        from groq import RateLimitError
+        
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                return self.groq_client.chat.completions.create(**kwargs)
+            except RateLimitError:
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = 2 ** attempt
+                logger.warning(f"Groq rate limit hit, retrying in {delay}s")
+                time.sleep(delay)
+    
     def analyze_article_sentiment_and_prediction(self, article):
         """
         Analyze each article for:
@@ -99,23 +204,64 @@ class ContrarianEarningsAnalyzer:
         2. Specific earnings predictions
         3. Confidence level
         """
+        prompt = ARTICLE_PROMPT_TEMPLATE.safe_substitute(
+            headline=article['headline'], author=article['author'], body=article['body']
+        )
+        
+        try:
+            response = self._groq_completion(
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                model="llama3-8b-8192",
+                temperature=0.1,
+                response_format={"type": "json_object"}
+            )
+            
+            analysis_text = response.choices[0].message.content
+            # Decode the first JSON object in the response in one pass
+            start_idx = analysis_text.find('{')
+            
+            if start_idx != -1:
+                analysis, _ = _JSON_DECODER.raw_decode(analysis_text, start_idx)
+                return analysis
+            else:
+                logger.error("Could not extract JSON from LLM response")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error analyzing article: {e}")
+            return None
+    
+    def analyze_articles_batch(self, articles):
+        """
+        Analyze articles concurrently, returning their analyses in input order
+        """
+        with ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS) as executor:
+            return list(executor.map(self.analyze_article_sentiment_and_prediction, articles))
+    
+    def analyze_article_group(self, articles):
+        """
+        Analyze several articles with a single Groq request, falling back to
+        per-article calls if the response is not a matching JSON array
+        """
+        blocks = "\n\n".join(
+            f"ARTICLE {n}:\n"
+            f"Headline: {article['headline']}\n"
+            f"Author: {article['author']}\n"
+            f"Content: {article['body']}..."
+            for n, article in enumerate(articles, 1)
+        )
+        
         prompt = f"""
-        Analyze this financial article about earnings expectations:
+        Analyze these {len(articles)} financial articles about earnings expectations:
         
-        Headline: {article['headline']}
-        Author: {article['author']}
-        Content: {article['body'][:2000]}...
+        {blocks}
         
-        Please provide analysis in JSON format:
-        {{
-            "sentiment": "bullish/bearish/neutral",
-            "confidence": "high/medium/low",
-            "earnings_prediction": "beat/miss/meet/unclear",
-            "specific_predictions": ["list of specific predictions made"],
-            "reasoning": "brief explanation of the analysis",
-            "key_concerns": ["main concerns or positive points mentioned"],
-            "prediction_confidence": "how confident the author seems about their prediction"
-        }}
+        Please provide analysis as a JSON array with exactly {len(articles)} objects,
+        one per article and in the same order, each in this format:
+        {ANALYSIS_SCHEMA}
         
         Focus on:
         - Overall tone about company prospects
@@ -125,9 +271,9 @@ class ContrarianEarningsAnalyzer:
         """
         
         try:
-            response = self.groq_client.chat.completions.create(
+            response = self._groq_completion(
                 messages=[
-                    {"role": "system", "content": "You are a financial analyst expert at analyzing earnings predictions and sentiment in financial articles."},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 model="llama3-8b-8192",
@@ -135,42 +281,94 @@ class ContrarianEarningsAnalyzer:
             )
             
             analysis_text = response.choices[0].message.content
-            # Extract JSON from response
-            start_idx = analysis_text.find('{')
-            end_idx = analysis_text.rfind('}') + 1
+            # Decode the first JSON array in the response in one pass
+            start_idx = analysis_text.find('[')
+            
+            if start_idx != -1:
+                analyses, _ = _JSON_DECODER.raw_decode(analysis_text, start_idx)
+                if len(analyses) == len(articles) and all(isinstance(a, dict) for a in analyses):
+                    return analyses
+            
+            logger.warning(f"Response did not contain {len(articles)} analyses, falling back to per-article calls")
             
-            if start_idx != -1 and end_idx != -1:
-                json_str = analysis_text[start_idx:end_idx]
-                analysis = json.loads(json_str)
-                return analysis
-            else:
-                logger.error("Could not extract JSON from LLM response")
-                return None
-                
         except Exception as e:
-            logger.error(f"Error analyzing article: {e}")
-            return None
+            logger.error(f"Error analyzing article group: {e}")
+        
+        return [self.analyze_article_sentiment_and_prediction(article) for article in articles]
+    
+    def analyze_articles_batched(self, articles, k=5):
+        """
+        Analyze articles k per Groq request, running the requests concurrently
+        and returning the analyses in input order
+        """
+        groups = [articles[i:i + k] for i in range(0, len(articles), k)]
+        with ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS) as executor:
+            return [analysis for group in executor.map(self.analyze_article_group, groups) for analysis in group]
     
     def get_actual_earnings_result(self, company_symbol, earnings_date):
+        """
+        Get actual earnings results, from the in-process or on-disk cache
+        when an entry exists, otherwise from yfinance
+        """
+        import pandas as pd
+        
+        earnings_dt = _as_datetime(earnings_date)
+        key = (company_symbol, f"{earnings_dt:%Y-%m-%d}")
+        
+        if key in self._earnings_results:
+            return dict(self._earnings_results[key])
+        
+        cache_path = os.path.join(self.earnings_cache_dir, f"{company_symbol}_{key[1]}.parquet")
+        
+        try:
+            if time.time() - os.path.getmtime(cache_path) < EARNINGS_CACHE_TTL_SECONDS:
+                result = pd.read_parquet(cache_path).to_dict(orient='records')[0]
+                self._earnings_results[key] = result
+                return dict(result)
+        except Exception:
+            pass  # Missing, stale or unreadable cache entry
+        
+        result = self._fetch_actual_earnings_result(company_symbol, earnings_dt)
+        
+        if result is not None:
+            self._earnings_results[key] = result
+            try:
+                os.makedirs(self.earnings_cache_dir, exist_ok=True)
+                pd.DataFrame([result]).to_parquet(cache_path)
+            except Exception as e:
+                logger.warning(f"Could not cache earnings result: {e}")
+            return dict(result)
+        
+        return None
+    
+    def _fetch_actual_earnings_result(self, company_symbol, earnings_date):
         """
         Get actual earnings results using yfinance or financial APIs
         """
+        import pandas as pd
+        import yfinance as yf
+        
         try:
             ticker = yf.Ticker(company_symbol)
             
             # Get earnings data around the earnings date
-            earnings_dt = datetime.strptime(earnings_date, "%Y-%m-%d")
+            earnings_dt = _as_datetime(earnings_date)
             
             # Get quarterly earnings
             earnings = ticker.quarterly_earnings
             
             if not earnings.empty:
                 # Find earnings closest to the target date
-                earnings.index = pd.to_datetime(earnings.index)
-                target_date = pd.to_datetime(earnings_date)
+                if not isinstance(earnings.index, pd.DatetimeIndex):
+                    earnings.index = pd.to_datetime(earnings.index, cache=True)
+                target_date = pd.Timestamp(earnings_dt)
                 
-                # Find the closest earnings date
-                closest_idx = (earnings.index - target_date).abs().idxmin()
+                # Find the closest earnings date: binary-search the sorted dates
+                # and take the nearer of the two neighbours
+                idx_sorted = earnings.index.sort_values()
+                pos = idx_sorted.searchsorted(target_date)
+                neighbours = idx_sorted[max(pos - 1, 0):pos + 1]
+                closest_idx = min(neighbours, key=lambda d: abs(d - target_date))
                 closest_earnings = earnings.loc[closest_idx]
                 
                 # Get stock price movement around earnings
@@ -202,97 +400,113 @@ class ContrarianEarningsAnalyzer:
         """
         Identify contrarian voices who were minority but correct
         """
-        # Count overall sentiment distribution
-        sentiment_counts = Counter([article['analysis']['sentiment'] for article in analyzed_articles if article['analysis']])
-        prediction_counts = Counter([article['analysis']['earnings_prediction'] for article in analyzed_articles if article['analysis']])
+        import numpy as np
+        import pandas as pd
+        
+        # One row per successfully analyzed article
+        valid_articles = [article for article in analyzed_articles if article['analysis']]
+        df = pd.DataFrame([article['analysis'] for article in valid_articles])
+        
+        if df.empty:
+            logger.info("No analyzed articles to compare")
+            return []
         
-        total_articles = len([a for a in analyzed_articles if a['analysis']])
+        # Share of articles holding each sentiment / prediction; null labels
+        # still count towards the total, as they did with Counter
+        sentiment_freq = df['sentiment'].value_counts(normalize=True, dropna=False)
+        prediction_freq = df['earnings_prediction'].value_counts(normalize=True, dropna=False)
         
-        logger.info(f"Sentiment distribution: {dict(sentiment_counts)}")
-        logger.info(f"Prediction distribution: {dict(prediction_counts)}")
+        logger.info(f"Sentiment distribution: {df['sentiment'].value_counts(dropna=False).to_dict()}")
+        logger.info(f"Prediction distribution: {df['earnings_prediction'].value_counts(dropna=False).to_dict()}")
         logger.info(f"Actual result: {actual_result}")
         
+        if not actual_result:
+            # Nobody can be shown correct without the actual result
+            return []
+        
+        # Determine if each author was minority (plain arrays from here on)
+        sentiments = df['sentiment'].to_numpy()
+        predictions = df['earnings_prediction'].to_numpy()
+        sentiment_share = df['sentiment'].map(sentiment_freq).to_numpy(dtype=float)
+        prediction_share = df['earnings_prediction'].map(prediction_freq).to_numpy(dtype=float)
+        is_minority_sentiment = sentiment_share < 0.3
+        is_minority_prediction = prediction_share < 0.3
+        
+        # Check if each author was correct
+        actual_sentiment = 'bullish' if actual_result['price_change_percent'] > 2 else 'bearish' if actual_result['price_change_percent'] < -2 else 'neutral'
+        sentiment_correct = sentiments == actual_sentiment
+        prediction_correct = predictions == actual_result['result']
+        
+        # Score only the calls that were both minority and correct
+        contrarian_score = (
+            np.where(is_minority_sentiment & sentiment_correct, (1 - sentiment_share) * 100, 0)
+            + np.where(is_minority_prediction & prediction_correct, (1 - prediction_share) * 100, 0)
+        )
+        is_contrarian = (is_minority_sentiment | is_minority_prediction) & (sentiment_correct | prediction_correct)
+        
+        # Contrarian rows by descending score; the stable sort keeps article order on ties
+        selected = np.flatnonzero(is_contrarian)
+        selected = selected[np.argsort(-contrarian_score[selected], kind='stable')]
+        
         contrarians = []
         
-        for article in analyzed_articles:
-            if not article['analysis']:
-                continue
-                
+        for i in selected:
+            article = valid_articles[i]
             analysis = article['analysis']
             
-            # Check if this author was contrarian
-            author_sentiment = analysis['sentiment']
-            author_prediction = analysis['earnings_prediction']
-            
-            # Determine if author was minority
-            is_minority_sentiment = sentiment_counts[author_sentiment] / total_articles < 0.3
-            is_minority_prediction = prediction_counts[author_prediction] / total_articles < 0.3
-            
-            # Check if author was correct
-            was_correct = False
-            
-            if actual_result:
-                # Check sentiment correctness
-                actual_sentiment = 'bullish' if actual_result['price_change_percent'] > 2 else 'bearish' if actual_result['price_change_percent'] < -2 else 'neutral'
-                sentiment_correct = author_sentiment == actual_sentiment
-                
-                # Check prediction correctness
-                prediction_correct = author_prediction == actual_result['result']
-                
-                was_correct = sentiment_correct or prediction_correct
-            
-            # Identify contrarians
-            if (is_minority_sentiment or is_minority_prediction) and was_correct:
-                contrarian_score = 0
-                if is_minority_sentiment and sentiment_correct:
-                    contrarian_score += (1 - sentiment_counts[author_sentiment] / total_articles) * 100
-                if is_minority_prediction and prediction_correct:
-                    contrarian_score += (1 - prediction_counts[author_prediction] / total_articles) * 100
-                
-                contrarians.append({
-                    'author': article['author'],
-                    'headline': article['headline'],
-                    'date': article['date'],
-                    'url': article['url'],
-                    'sentiment': author_sentiment,
-                    'prediction': author_prediction,
-                    'was_minority_sentiment': is_minority_sentiment,
-                    'was_minority_prediction': is_minority_prediction,
-                    'contrarian_score': round(contrarian_score, 2),
-                    'reasoning': analysis['reasoning'],
-                    'key_concerns': analysis['key_concerns']
-                })
-        
-        # Sort by contrarian score
-        contrarians.sort(key=lambda x: x['contrarian_score'], reverse=True)
+            contrarians.append({
+                'author': article['author'],
+                'headline': article['headline'],
+                'date': article['date'],
+                'url': article['url'],
+                'sentiment': analysis['sentiment'],
+                'prediction': analysis['earnings_prediction'],
+                'was_minority_sentiment': bool(is_minority_sentiment[i]),
+                'was_minority_prediction': bool(is_minority_prediction[i]),
+                'contrarian_score': round(float(contrarian_score[i]), 2),
+                'reasoning': analysis['reasoning'],
+                'key_concerns': analysis['key_concerns']
+            })
         
         return contrarians
     
-    def analyze_company_earnings(self, company_name, company_symbol, earnings_date):
+    def analyze_company_earnings(self, company_name, company_symbol, earnings_date, articles_per_prompt=1):
         """
-        Main analysis function
+        Main analysis function. With articles_per_prompt > 1, articles are
+        packed that many to a Groq request.
         """
         logger.info(f"Starting contrarian analysis for {company_name} ({company_symbol}) - Earnings: {earnings_date}")
         
+        # Parse the date once; the steps below take the datetime
+        earnings_dt = _as_datetime(earnings_date)
+        
         # Step 1: Collect pre-earnings articles
-        articles = self.collect_pre_earnings_articles(company_name, earnings_date)
+        articles = self.collect_pre_earnings_articles(company_name, earnings_dt)
         
         if not articles:
             logger.error("No articles found")
             return None
         
-        # Step 2: Analyze each article
-        analyzed_articles = []
-        for i, article in enumerate(articles[:20]):  # Limit to 20 articles for API costs
-            logger.info(f"Analyzing article {i+1}/{min(20, len(articles))}")
-            analysis = self.analyze_article_sentiment_and_prediction(article)
-            analyzed_articles.append({
-                **article,
-                'analysis': analysis
-            })
-        
-        # Step 3: Get actual earnings results
-        actual_result = self.get_actual_earnings_result(company_symbol, earnings_date)
+        # Steps 2 and 3 are independent: the earnings lookup only needs the
+        # symbol and date, so it runs alongside the article analysis
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            earnings_future = executor.submit(self.get_actual_earnings_result, company_symbol, earnings_dt)
+            
+            # Step 2: Analyze the articles concurrently
+            articles = articles[:20]  # Limit to 20 articles for API costs
+            logger.info(f"Analyzing {len(articles)} articles")
+            if articles_per_prompt > 1:
+                analyses = self.analyze_articles_batched(articles, articles_per_prompt)
+            else:
+                analyses = self.analyze_articles_batch(articles)
+            
+            # The article dicts were built for this run, so attach in place
+            for article, analysis in zip(articles, analyses):
+                article['analysis'] = analysis
+            analyzed_articles = articles
+            
+            # Step 3: Get actual earnings results
+            actual_result = earnings_future.result()
         
         # Step 4: Identify contrarians
         contrarians = self.identify_contrarians(analyzed_articles, actual_result)
@@ -301,7 +515,7 @@ class ContrarianEarningsAnalyzer:
         report = {
             'company': company_name,
             'symbol': company_symbol,
-            'earnings_date': earnings_date,
+            'earnings_date': earnings_date if isinstance(earnings_date, str) else f"{earnings_dt:%Y-%m-%d}",
             'analysis_date': datetime.now().isoformat(),
             'total_articles_analyzed': len(analyzed_articles),
             'actual_result': actual_result,
@@ -331,8 +545,16 @@ class ContrarianEarningsAnalyzer:
         os.makedirs(reports_dir, exist_ok=True)
         filepath = os.path.join(reports_dir, filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(
+                report, default=json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            data = json.dumps(report, indent=2, default=str).encode('utf-8')
+        
+        with open(filepath, 'wb') as f:
+            f.write(data)
         
         logger.info(f"Report saved to {filepath}")
         return filepath
@@ -351,7 +573,7 @@ def main():
     
     print(f"Analyzing contrarian voices for {company_name} earnings on {earnings_date}")
     
-    report = analyzer.analyze_company_earnings(company_name, company_symbol, earnings_date)
+    report = analyzer.analyze_company_earnings(company_name, company_symbol, earnings_date, articles_per_prompt=5)
     
     if report:
         # Save report
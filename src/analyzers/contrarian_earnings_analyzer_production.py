@@ -14,7 +14,10 @@ Key improvements:
 - Batch processing with delays
 """
 
-import requests
+import asyncio
+import aiohttp
+import hashlib
+import shelve
 import pandas as pd
 import json
 from datetime import datetime, timedelta
@@ -22,13 +25,18 @@ from dotenv import load_dotenv
 import os
 from collections import defaultdict, Counter
 import yfinance as yf
-from groq import Groq
+from groq import AsyncGroq, RateLimitError
 import logging
 import time
-from typing import List, Dict, Optional
-import random
+from typing import Callable, List, Dict, Optional
 from dataclasses import dataclass
-from .contrarian_csv_exporter import ContrarianCSVExporter
+from .json_utils import json_default
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(
@@ -41,16 +49,105 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+GUARDIAN_SEARCH_URL = "https://content.guardianapis.com/search"
+GROQ_MODEL = "llama3-8b-8192"
+
+# Retries after a 429 before giving up on a request
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Guardian search results can change; Groq classifications are deterministic per prompt
+GUARDIAN_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Batched classification: shorter excerpts keep several articles within the model context
+BATCH_CONTENT_CHARS = 1000
+BATCH_TOKENS_PER_ARTICLE = 400
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Keep-alive HTTP session so Guardian requests reuse TCP/TLS connections"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=20, limit_per_host=10, keepalive_timeout=60)
+    )
+
+def dump_report_json(report: Dict) -> bytes:
+    """Serialize a report as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        # OPT_NON_STR_KEYS writes None keys (e.g. a null sentiment tally) as "null", like json.dumps
+        return orjson.dumps(
+            report, default=json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(report, indent=2, default=str).encode('utf-8')
+
 @dataclass
 class RateLimitConfig:
     """Configuration for API rate limiting"""
     guardian_requests_per_minute: int = 12  # Guardian API free tier: 12 requests/minute
     groq_requests_per_minute: int = 30      # Groq free tier: 30 requests/minute
-    min_delay_between_requests: float = 1.0  # Minimum delay between requests
-    max_delay_between_requests: float = 3.0  # Maximum delay for jitter
+
+class TokenBucket:
+    """
+    Token bucket rate limiter: bursts up to capacity, refills at a steady rate
+    """
+    def __init__(self, capacity: float, refill_rate: float,
+                 tokens: Optional[float] = None, last_refill_timestamp: Optional[float] = None):
+        self.capacity = capacity
+        # Saved state from an earlier run; refill() credits the idle time since then
+        self.tokens = capacity if tokens is None else min(capacity, tokens)
+        self.refill_rate = refill_rate  # Tokens per second
+        self.last_refill_timestamp = time.time() if last_refill_timestamp is None else last_refill_timestamp
+    
+    def refill(self):
+        """Credit tokens for the time elapsed since the last refill"""
+        now = time.time()
+        elapsed = now - self.last_refill_timestamp
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill_timestamp = now
+    
+    def allow_request(self, n: int = 1) -> bool:
+        """Consume n tokens if available"""
+        self.refill()
+        if self.tokens >= n:
+            self.tokens -= n
+            return True
+        return False
+
+class ResponseCache:
+    """
+    Shelf-backed cache of API responses, keyed by a hash of the request parameters
+    """
+    def __init__(self, cache_dir: str):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "responses")
+    
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Stable key for a request"""
+        return hashlib.blake2b(repr(parts).encode("utf-8")).hexdigest()
+    
+    def get(self, key: str, ttl: Optional[float] = None):
+        """Return the cached value, or None if missing or older than ttl seconds"""
+        with shelve.open(self.path) as cache:
+            entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if ttl is not None and time.time() - stored_at > ttl:
+            return None
+        return value
+    
+    def set(self, key: str, value):
+        with shelve.open(self.path) as cache:
+            cache[key] = (time.time(), value)
+    
+    def clear(self):
+        with shelve.open(self.path) as cache:
+            cache.clear()
 
 class ProductionContrarianEarningsAnalyzer:
-    def __init__(self, rate_limit_config: Optional[RateLimitConfig] = None):
+    def __init__(self, rate_limit_config: Optional[RateLimitConfig] = None,
+                 guardian_bucket: Optional[TokenBucket] = None,
+                 groq_bucket: Optional[TokenBucket] = None,
+                 cache: Optional[ResponseCache] = None):
         load_dotenv()
         self.guardian_api_key = os.getenv("GUARDIAN_API_KEY")
         self.groq_api_key = os.getenv("GROQ_API_KEY")
@@ -60,45 +157,110 @@ class ProductionContrarianEarningsAnalyzer:
         if not self.groq_api_key:
             raise ValueError("GROQ_API_KEY not found in environment variables")
             
-        self.groq_client = Groq(api_key=self.groq_api_key)
+        self.groq_client = AsyncGroq(api_key=self.groq_api_key)
         self.rate_limit = rate_limit_config or RateLimitConfig()
         
+        # One bucket per API: capacity = per-minute quota, refilled every second
+        self.guardian_bucket = guardian_bucket or TokenBucket(
+            self.rate_limit.guardian_requests_per_minute,
+            self.rate_limit.guardian_requests_per_minute / 60.0
+        )
+        self.groq_bucket = groq_bucket or TokenBucket(
+            self.rate_limit.groq_requests_per_minute,
+            self.rate_limit.groq_requests_per_minute / 60.0
+        )
+        
+        self.cache = cache
+        
         # Track API usage
         self.guardian_requests_count = 0
         self.groq_requests_count = 0
-        self.last_guardian_request = 0
-        self.last_groq_request = 0
-        
-    def _wait_for_rate_limit(self, api_type: str):
-        """Implement rate limiting with jitter"""
-        current_time = time.time()
-        
-        if api_type == "guardian":
-            time_since_last = current_time - self.last_guardian_request
-            min_interval = 60 / self.rate_limit.guardian_requests_per_minute
-        elif api_type == "groq":
-            time_since_last = current_time - self.last_groq_request
-            min_interval = 60 / self.rate_limit.groq_requests_per_minute
-        else:
-            min_interval = self.rate_limit.min_delay_between_requests
-            time_since_last = 0
-            
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            # Add jitter to avoid thundering herd
-            jitter = random.uniform(0, min(1.0, sleep_time * 0.1))
-            total_sleep = sleep_time + jitter
-            logger.info(f"Rate limiting: sleeping for {total_sleep:.2f} seconds")
-            time.sleep(total_sleep)
-            
-        # Add random delay between requests
-        delay = random.uniform(
-            self.rate_limit.min_delay_between_requests,
-            self.rate_limit.max_delay_between_requests
-        )
-        time.sleep(delay)
         
-    def collect_pre_earnings_articles(self, company_name: str, earnings_date: str, days_before: int = 30) -> List[Dict]:
+    async def _wait_for_rate_limit(self, api_type: str):
+        """Wait until the API's token bucket allows another request"""
+        bucket = self.guardian_bucket if api_type == "guardian" else self.groq_bucket
+        
+        while not bucket.allow_request():
+            # Sleep only for the exact token deficit
+            sleep_time = (1 - bucket.tokens) / bucket.refill_rate
+            logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+            await asyncio.sleep(sleep_time)
+    
+    def _penalize_rate_limit(self, api_type: str, retry_after: Optional[str] = None):
+        """
+        Drain the API's bucket after a 429 so the next _wait_for_rate_limit
+        sleeps until the server's window has refilled
+        """
+        bucket = self.guardian_bucket if api_type == "guardian" else self.groq_bucket
+        bucket.refill()
+        
+        try:
+            # Retry-After (seconds) sets the deficit exactly
+            bucket.tokens = 1 - float(retry_after) * bucket.refill_rate
+        except (TypeError, ValueError):
+            bucket.tokens = min(-1, bucket.tokens - bucket.refill_rate)
+        
+        logger.warning(f"Rate limit exceeded for {api_type}, backing off {(1 - bucket.tokens) / bucket.refill_rate:.2f} seconds")
+    
+    async def _groq_completion(self, **kwargs):
+        """Groq chat completion gated by the bucket, retrying 429s with a bucket penalty"""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self._wait_for_rate_limit("groq")
+            try:
+                response = await self.groq_client.chat.completions.create(**kwargs)
+                self.groq_requests_count += 1
+                return response
+            except RateLimitError as e:
+                self.groq_requests_count += 1
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                self._penalize_rate_limit("groq", e.response.headers.get("retry-after"))
+    
+    async def _fetch_guardian_page(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                   params: Dict, page: int) -> Optional[Dict]:
+        """Fetch one page of Guardian search results, or None on failure"""
+        cache_key = None
+        if self.cache:
+            request = {k: v for k, v in params.items() if k != "api-key"}
+            cache_key = self.cache.make_key("guardian", sorted(request.items()), page)
+            cached = self.cache.get(cache_key, ttl=GUARDIAN_CACHE_TTL_SECONDS)
+            if cached is not None:
+                logger.info(f"Using cached page {page}")
+                return cached
+        
+        async with semaphore:
+            try:
+                for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                    await self._wait_for_rate_limit("guardian")
+                    
+                    logger.info(f"Fetching page {page}")
+                    
+                    async with session.get(GUARDIAN_SEARCH_URL, params={**params, "page": page}) as response:
+                        self.guardian_requests_count += 1
+                        
+                        if response.status == 429:  # Rate limit exceeded
+                            self._penalize_rate_limit("guardian", response.headers.get("Retry-After"))
+                            continue
+                        
+                        if response.status != 200:
+                            logger.error(f"API request failed: {response.status} - {await response.text()}")
+                            return None
+                        
+                        data = await response.json()
+                        if cache_key:
+                            self.cache.set(cache_key, data)
+                        return data
+                
+                logger.error(f"Giving up on page {page} after {MAX_RATE_LIMIT_RETRIES} rate-limit retries")
+                return None
+                        
+            except Exception as e:
+                logger.error(f"Error fetching page {page}: {e}")
+                return None
+        
+
+    async def collect_pre_earnings_articles(self, session: aiohttp.ClientSession, company_name: str,
+                                            earnings_date: str, days_before: int = 30) -> List[Dict]:
         """
         Collect articles about the company published before earnings date with rate limiting
         """
@@ -111,77 +273,66 @@ class ProductionContrarianEarningsAnalyzer:
         
         logger.info(f"Search date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
         
-        articles = []
-        page = 1
+        params = {
+            "api-key": self.guardian_api_key,
+            "q": company_name,
+            "from-date": start_date.strftime("%Y-%m-%d"),
+            "to-date": end_date.strftime("%Y-%m-%d"),
+            "page-size": 50,
+            "show-fields": "all",
+            "order-by": "newest",
+            "section": "business|technology|money"  # Focus on relevant sections
+        }
         max_pages = 10  # Increased for 30-day period
         
-        while page <= max_pages:
-            try:
-                # Rate limiting
-                self._wait_for_rate_limit("guardian")
-                
-                logger.info(f"Fetching page {page}/{max_pages}")
-                
-                response = requests.get("https://content.guardianapis.com/search", params={
-                    "api-key": self.guardian_api_key,
-                    "q": company_name,
-                    "from-date": start_date.strftime("%Y-%m-%d"),
-                    "to-date": end_date.strftime("%Y-%m-%d"),
-                    "page-size": 50,
-                    "page": page,
-                    "show-fields": "all",
-                    "order-by": "newest",
-                    "section": "business|technology|money"  # Focus on relevant sections
-                })
-                
-                self.last_guardian_request = time.time()
-                self.guardian_requests_count += 1
-                
-                if response.status_code == 429:  # Rate limit exceeded
-                    logger.warning("Rate limit exceeded, waiting longer...")
-                    time.sleep(60)  # Wait 1 minute
-                    continue
-                    
-                if response.status_code != 200:
-                    logger.error(f"API request failed: {response.status_code} - {response.text}")
-                    break
-                    
-                data = response.json()
-                
-                if 'response' not in data or 'results' not in data['response']:
-                    logger.error("Unexpected API response structure")
-                    break
-                    
-                results = data['response']['results']
-                if not results:
-                    logger.info(f"No more results found on page {page}")
-                    break
-                    
-                page_articles = 0
-                for article in results:
-                    if 'fields' in article and article['fields'].get('bodyText'):
-                        # Filter for substantial articles
-                        body_text = article['fields'].get('bodyText', '')
-                        if len(body_text) > 200:  # Only articles with substantial content
-                            articles.append({
-                                'headline': article['fields'].get('headline', ''),
-                                'body': body_text,
-                                'author': article['fields'].get('byline', 'Unknown'),
-                                'date': article['fields'].get('firstPublicationDate', ''),
-                                'url': article['fields'].get('shortUrl', ''),
-                                'trail_text': article['fields'].get('trailText', ''),
-                                'section': article.get('sectionName', ''),
-                                'word_count': len(body_text.split())
-                            })
-                            page_articles += 1
+        # Concurrent page fetches are capped at the bucket's burst capacity
+        semaphore = asyncio.Semaphore(max(1, int(self.guardian_bucket.capacity)))
+        
+        # The first page reports how many pages exist; fetch the rest concurrently
+        pages = [await self._fetch_guardian_page(session, semaphore, params, 1)]
+        first = pages[0]
+        if first and 'response' in first:
+            total_pages = min(max_pages, first['response'].get('pages', 1))
+            pages += await asyncio.gather(*[
+                self._fetch_guardian_page(session, semaphore, params, page)
+                for page in range(2, total_pages + 1)
+            ])
+        
+        articles = []
+        
+        for page, data in enumerate(pages, 1):
+            if data is None:
+                break
                 
-                logger.info(f"Page {page}: Found {page_articles} relevant articles")
-                page += 1
+            if 'response' not in data or 'results' not in data['response']:
+                logger.error("Unexpected API response structure")
+                break
                 
-            except Exception as e:
-                logger.error(f"Error fetching page {page}: {e}")
+            results = data['response']['results']
+            if not results:
+                logger.info(f"No more results found on page {page}")
                 break
                 
+            page_articles = 0
+            for article in results:
+                if 'fields' in article and article['fields'].get('bodyText'):
+                    # Filter for substantial articles
+                    body_text = article['fields'].get('bodyText', '')
+                    if len(body_text) > 200:  # Only articles with substantial content
+                        articles.append({
+                            'headline': article['fields'].get('headline', ''),
+                            'body': body_text,
+                            'author': article['fields'].get('byline', 'Unknown'),
+                            'date': article['fields'].get('firstPublicationDate', ''),
+                            'url': article['fields'].get('shortUrl', ''),
+                            'trail_text': article['fields'].get('trailText', ''),
+                            'section': article.get('sectionName', ''),
+                            'word_count': len(body_text.split())
+                        })
+                        page_articles += 1
+            
+            logger.info(f"Page {page}: Found {page_articles} relevant articles")
+                
         logger.info(f"Total articles collected: {len(articles)}")
         
         # Sort by date (newest first) and word count (longer articles first)
@@ -189,14 +340,11 @@ class ProductionContrarianEarningsAnalyzer:
         
         return articles
     
-    def analyze_article_sentiment_and_prediction(self, article: Dict) -> Optional[Dict]:
+    async def analyze_article_sentiment_and_prediction(self, article: Dict) -> Optional[Dict]:
         """
         Analyze each article with rate limiting and better error handling
         """
         try:
-            # Rate limiting for Groq API
-            self._wait_for_rate_limit("groq")
-            
             # Truncate content to avoid token limits
             content = article['body'][:3000]  # Increased limit for better analysis
             
@@ -230,19 +378,23 @@ class ProductionContrarianEarningsAnalyzer:
             - Confidence level of predictions
             """
             
-            response = self.groq_client.chat.completions.create(
+            cache_key = None
+            if self.cache:
+                cache_key = self.cache.make_key("groq", GROQ_MODEL, prompt)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            
+            response = await self._groq_completion(
                 messages=[
                     {"role": "system", "content": "You are a financial analyst expert at analyzing earnings predictions and sentiment in financial articles. Always respond with valid JSON."},
                     {"role": "user", "content": prompt}
                 ],
-                model="llama3-8b-8192",
+                model=GROQ_MODEL,
                 temperature=0.1,
                 max_tokens=1000
             )
             
-            self.last_groq_request = time.time()
-            self.groq_requests_count += 1
-            
             analysis_text = response.choices[0].message.content
             
             # Extract JSON from response
@@ -253,12 +405,10 @@ class ProductionContrarianEarningsAnalyzer:
                 json_str = analysis_text[start_idx:end_idx]
                 analysis = json.loads(json_str)
                 
-                # Validate required fields
-                required_fields = ['sentiment', 'earnings_prediction', 'confidence']
-                for field in required_fields:
-                    if field not in analysis:
-                        logger.warning(f"Missing required field {field} in analysis")
-                        analysis[field] = 'unclear'
+                analysis = self._validate_analysis(analysis)
+                
+                if cache_key:
+                    self.cache.set(cache_key, analysis)
                         
                 return analysis
             else:
@@ -272,6 +422,127 @@ class ProductionContrarianEarningsAnalyzer:
             logger.error(f"Error analyzing article: {e}")
             return None
     
+    @staticmethod
+    def _validate_analysis(analysis: Dict) -> Dict:
+        """Fill in required fields missing from an LLM analysis"""
+        required_fields = ['sentiment', 'earnings_prediction', 'confidence']
+        for field in required_fields:
+            if field not in analysis:
+                logger.warning(f"Missing required field {field} in analysis")
+                analysis[field] = 'unclear'
+        return analysis
+    
+    async def analyze_article_batch(self, articles: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Classify several articles with a single Groq request, falling back to
+        per-article calls if the response does not match the batch
+        """
+        blocks = []
+        for n, article in enumerate(articles, 1):
+            content = article['body'][:BATCH_CONTENT_CHARS]
+            blocks.append(
+                f"[{n}] Headline: {article['headline']}\n"
+                f"Author: {article['author']}\n"
+                f"Date: {article['date']}\n"
+                f"Section: {article.get('section', 'N/A')}\n"
+                f"Content: {content}..."
+            )
+        
+        prompt = f"""
+            Classify each of the following {len(articles)} financial articles written before an earnings release.
+            
+            Return a JSON object of the form {{"analyses": [...]}} with exactly {len(articles)} entries,
+            in the same order as the articles, each in this format:
+            {{
+                "sentiment": "bullish/bearish/neutral",
+                "confidence": "high/medium/low",
+                "earnings_prediction": "beat/miss/meet/unclear",
+                "prediction_confidence": "high/medium/low",
+                "reasoning": "brief explanation of the analysis",
+                "key_concerns": ["main concerns or positive points mentioned"],
+                "contrarian_indicators": ["signs this might be a contrarian view"]
+            }}
+            
+            """ + "\n\n".join(blocks)
+        
+        try:
+            response = await self._groq_completion(
+                messages=[
+                    {"role": "system", "content": "You are a financial analyst expert at analyzing earnings predictions and sentiment in financial articles. Always respond with valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                model=GROQ_MODEL,
+                temperature=0.1,
+                max_tokens=BATCH_TOKENS_PER_ARTICLE * len(articles),
+                response_format={"type": "json_object"}
+            )
+            
+            analyses = json.loads(response.choices[0].message.content).get('analyses')
+            
+            if isinstance(analyses, list) and len(analyses) == len(articles) and all(isinstance(a, dict) for a in analyses):
+                return [self._validate_analysis(analysis) for analysis in analyses]
+            
+            logger.warning(f"Batch response did not contain {len(articles)} analyses, falling back to per-article calls")
+            
+        except Exception as e:
+            logger.error(f"Error analyzing article batch: {e}")
+        
+        return [await self.analyze_article_sentiment_and_prediction(article) for article in articles]
+    
+    async def analyze_articles(self, articles: List[Dict], batch_size: int = 1,
+                               progress: Optional[Callable[..., None]] = None) -> List[Optional[Dict]]:
+        """
+        Analyze articles concurrently, capped at the Groq bucket's burst capacity.
+        With batch_size > 1, articles are classified batch_size at a time per request.
+        progress, if given, is first called as progress(0, total=len(articles)),
+        then with the number of articles just classified.
+        """
+        progress = progress or (lambda n, total=None: None)
+        progress(0, total=len(articles))
+        semaphore = asyncio.Semaphore(max(1, int(self.groq_bucket.capacity)))
+        
+        if batch_size <= 1:
+            async def analyze(i: int, article: Dict) -> Optional[Dict]:
+                async with semaphore:
+                    logger.info(f"Analyzing article {i+1}/{len(articles)}: {article['headline'][:50]}...")
+                    analysis = await self.analyze_article_sentiment_and_prediction(article)
+                progress(1)
+                return analysis
+            
+            return list(await asyncio.gather(*[analyze(i, article) for i, article in enumerate(articles)]))
+        
+        # Reuse cached batch classifications; only uncached articles are sent
+        results = [None] * len(articles)
+        cache_keys = [None] * len(articles)
+        pending = []
+        
+        for i, article in enumerate(articles):
+            if self.cache:
+                cache_keys[i] = self.cache.make_key(
+                    "groq-batch", GROQ_MODEL, article['url'], article['headline'], article['body'][:BATCH_CONTENT_CHARS]
+                )
+                results[i] = self.cache.get(cache_keys[i])
+            if results[i] is None:
+                pending.append(i)
+        
+        progress(len(articles) - len(pending))
+        batches = [pending[k:k + batch_size] for k in range(0, len(pending), batch_size)]
+        
+        async def analyze_batch(batch: List[int]) -> List[Optional[Dict]]:
+            async with semaphore:
+                logger.info(f"Analyzing {len(batch)} articles in one request ({batch[0]+1}-{batch[-1]+1}/{len(articles)})")
+                analyses = await self.analyze_article_batch([articles[i] for i in batch])
+            progress(len(batch))
+            return analyses
+        
+        for batch, analyses in zip(batches, await asyncio.gather(*[analyze_batch(batch) for batch in batches])):
+            for i, analysis in zip(batch, analyses):
+                results[i] = analysis
+                if cache_keys[i] and analysis is not None:
+                    self.cache.set(cache_keys[i], analysis)
+        
+        return results
+    
     def get_actual_earnings_result(self, company_symbol: str, earnings_date: str) -> Optional[Dict]:
         """
         Get actual earnings results with better error handling
@@ -443,17 +714,24 @@ class ProductionContrarianEarningsAnalyzer:
         
         return contrarians
     
-    def analyze_company_earnings(self, company_name: str, company_symbol: str, earnings_date: str, days_before: int = 30, max_articles: int = 50) -> Optional[Dict]:
+    async def analyze_company_earnings(self, company_name: str, company_symbol: str, earnings_date: str, days_before: int = 30, max_articles: int = 50, batch_size: int = 1,
+                                       session: Optional[aiohttp.ClientSession] = None,
+                                       progress: Optional[Callable[..., None]] = None) -> Optional[Dict]:
         """
-        Main analysis function with production-ready features
+        Main analysis function with production-ready features.
+        Pass a session from create_http_session() to share connections across analyses.
         """
         start_time = time.time()
         logger.info(f"Starting contrarian analysis for {company_name} ({company_symbol}) - Earnings: {earnings_date}")
-        logger.info(f"Analysis parameters: {days_before} days before, max {max_articles} articles")
+        logger.info(f"Analysis parameters: {days_before} days before, max {max_articles} articles, batch size {batch_size}")
         
         try:
             # Step 1: Collect pre-earnings articles
-            articles = self.collect_pre_earnings_articles(company_name, earnings_date, days_before)
+            if session is not None:
+                articles = await self.collect_pre_earnings_articles(session, company_name, earnings_date, days_before)
+            else:
+                async with create_http_session() as own_session:
+                    articles = await self.collect_pre_earnings_articles(own_session, company_name, earnings_date, days_before)
             
             if not articles:
                 logger.error("No articles found")
@@ -463,27 +741,14 @@ class ProductionContrarianEarningsAnalyzer:
             articles_to_analyze = articles[:max_articles]
             logger.info(f"Analyzing top {len(articles_to_analyze)} articles out of {len(articles)} found")
             
-            # Step 2: Analyze each article with progress tracking
-            analyzed_articles = []
-            failed_analyses = 0
+            # Step 2: Analyze articles concurrently
+            analyses = await self.analyze_articles(articles_to_analyze, batch_size, progress)
             
-            for i, article in enumerate(articles_to_analyze):
-                logger.info(f"Analyzing article {i+1}/{len(articles_to_analyze)}: {article['headline'][:50]}...")
-                
-                analysis = self.analyze_article_sentiment_and_prediction(article)
-                
-                analyzed_articles.append({
-                    **article,
-                    'analysis': analysis
-                })
-                
-                if analysis is None:
-                    failed_analyses += 1
-                    
-                # Progress update every 10 articles
-                if (i + 1) % 10 == 0:
-                    success_rate = ((i + 1 - failed_analyses) / (i + 1)) * 100
-                    logger.info(f"Progress: {i+1}/{len(articles_to_analyze)} articles analyzed (Success rate: {success_rate:.1f}%)")
+            analyzed_articles = [
+                {**article, 'analysis': analysis}
+                for article, analysis in zip(articles_to_analyze, analyses)
+            ]
+            failed_analyses = sum(1 for analysis in analyses if analysis is None)
             
             logger.info(f"Article analysis complete. Success rate: {((len(articles_to_analyze) - failed_analyses) / len(articles_to_analyze)) * 100:.1f}%")
             
@@ -504,6 +769,7 @@ class ProductionContrarianEarningsAnalyzer:
                 'analysis_parameters': {
                     'days_before_earnings': days_before,
                     'max_articles_analyzed': max_articles,
+                    'batch_size': batch_size,
                     'analysis_duration_seconds': round(analysis_time, 2)
                 },
                 'data_collection': {
@@ -535,7 +801,8 @@ class ProductionContrarianEarningsAnalyzer:
             logger.error(f"Analysis failed: {e}")
             return None
     
-    def save_report(self, report: Dict, filename: Optional[str] = None) -> str:
+    def save_report(self, report: Dict, filename: Optional[str] = None,
+                    serializer: Callable[[Dict], bytes] = dump_report_json) -> str:
         """
         Save the contrarian analysis report with backup
         """
@@ -558,11 +825,14 @@ class ProductionContrarianEarningsAnalyzer:
         outputs_filepath = os.path.join(outputs_dir, filename)
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            # Serialize once, write both copies
+            payload = serializer(report)
             
-            with open(outputs_filepath, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+            
+            with open(outputs_filepath, 'wb') as f:
+                f.write(payload)
             
             logger.info(f"Report saved to {filepath} and {outputs_filepath}")
             return filepath
@@ -578,9 +848,7 @@ def main():
     # Initialize analyzer with rate limiting
     rate_config = RateLimitConfig(
         guardian_requests_per_minute=10,  # Conservative rate
-        groq_requests_per_minute=25,     # Conservative rate
-        min_delay_between_requests=1.5,
-        max_delay_between_requests=3.0
+        groq_requests_per_minute=25      # Conservative rate
     )
     
     analyzer = ProductionContrarianEarningsAnalyzer(rate_config)
@@ -594,19 +862,21 @@ def main():
     print(f"This will analyze articles from 30 days before the earnings date...")
     print(f"Rate limiting: Guardian API max {rate_config.guardian_requests_per_minute}/min, Groq API max {rate_config.groq_requests_per_minute}/min")
     
-    report = analyzer.analyze_company_earnings(
+    report = asyncio.run(analyzer.analyze_company_earnings(
         company_name=company_name,
         company_symbol=company_symbol,
         earnings_date=earnings_date,
         days_before=30,
         max_articles=30  # Reasonable limit for free APIs
-    )
+    ))
     
     if report:
         # Save report
         filepath = analyzer.save_report(report)
         
         # Export to CSV
+        from .contrarian_csv_exporter import ContrarianCSVExporter
+        
         csv_exporter = ContrarianCSVExporter()
         
         print("\nExporting data to CSV files...")
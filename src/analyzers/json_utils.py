@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+JSON helpers shared by the analyzers when writing reports.
+
+Kept free of heavy imports so any analyzer can use it without pulling in
+pandas, groq or aiohttp.
+"""
+
+def json_default(obj):
+    """Fallback for report values the JSON encoder does not handle natively"""
+    if isinstance(obj, float):
+        return float(obj)  # float subclasses such as numpy.float64
+    if hasattr(obj, 'item'):
+        return obj.item()  # other numpy scalars
+    return str(obj)
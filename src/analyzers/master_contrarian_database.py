@@ -8,12 +8,28 @@ and contrarian patterns over time.
 """
 
 import csv
+import importlib.util
 import json
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
 
+# pyarrow is only needed by pandas (Parquet mirror, CSV engine), so just check it is installed
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Explicit dtypes for the master CSV columns used by read-only views.
+# Highly repetitive labels are categorical; Companies_List stays a string
+# because callers split it into individual companies.
+MASTER_DTYPES = {
+    'Author_Name': 'category',
+    'Latest_Company': 'category',
+    'Risk_Level': 'category',
+    'Companies_List': 'string',
+    'Contrarian_Success_Rate': 'float32',
+    'Total_Contrarian_Instances': 'int32'
+}
+
 class MasterContrarianDatabase:
     """
     Manages a master database of contrarian analysts with historical tracking
@@ -31,8 +47,13 @@ class MasterContrarianDatabase:
             self.database_dir = database_dir
             
         self.master_csv_path = os.path.join(self.database_dir, "master_contrarian_database.csv")
+        self.master_parquet_path = os.path.join(self.database_dir, "master_contrarian_database.parquet")
         self.author_history_dir = os.path.join(self.database_dir, "author_histories")
         
+        # Parsed master CSV, keyed on the file's (mtime_ns, size) so writes by any instance invalidate it
+        self._df_cache = None
+        self._df_cache_key = None
+        
         # Create directories
         os.makedirs(self.database_dir, exist_ok=True)
         os.makedirs(self.author_history_dir, exist_ok=True)
@@ -98,15 +119,31 @@ class MasterContrarianDatabase:
         """
         Add new contrarian analysis results to the master database
         """
+        self.add_contrarian_analyses_bulk([(report_data, contrarians)])
+    
+    def add_contrarian_analyses_bulk(self, payloads: List[Tuple[Dict, List[Dict]]]):
+        """
+        Add several (report_data, contrarians) results, loading and rewriting
+        the master CSV only once for the whole batch
+        """
+        # Load existing data
+        updated_data = self._load_existing_data()
+        updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        for report_data, contrarians in payloads:
+            self._apply_contrarian_analysis(updated_data, report_data, contrarians, updated_at)
+        
+        # Save updated master database
+        self._save_master_database(updated_data)
+    
+    def _apply_contrarian_analysis(self, updated_data: Dict[str, Dict], report_data: Dict, contrarians: List[Dict],
+                                   updated_at: str):
+        """Apply one report's contrarians to the in-memory master data"""
         company = report_data.get('company', 'Unknown')
         symbol = report_data.get('symbol', 'UNK')
         earnings_date = report_data.get('earnings_date', '')
         actual_result = report_data.get('actual_result', {})
         
-        # Load existing data
-        existing_data = self._load_existing_data()
-        updated_data = existing_data.copy()
-        
         print(f"\nUpdating master contrarian database for {company} ({symbol}) - {earnings_date}")
         print(f"Found {len(contrarians)} contrarian(s) to process")
         
@@ -123,20 +160,17 @@ class MasterContrarianDatabase:
                 # Update existing author
                 author_data = updated_data[author_id]
                 self._update_existing_author(author_data, company, symbol, earnings_date, 
-                                           contrarian_type, was_correct, contrarian_score)
+                                           contrarian_type, was_correct, contrarian_score, updated_at)
             else:
                 # Add new author
                 author_data = self._create_new_author_record(author_name, author_id, company, 
                                                            symbol, earnings_date, contrarian_type, 
-                                                           was_correct, contrarian_score)
+                                                           was_correct, contrarian_score, updated_at)
                 updated_data[author_id] = author_data
             
             # Save individual author history
             self._save_author_history(author_id, author_name, company, symbol, 
-                                    earnings_date, contrarian, was_correct)
-        
-        # Save updated master database
-        self._save_master_database(updated_data)
+                                    earnings_date, contrarian, was_correct, updated_at)
         
         # Generate summary report
         self._generate_update_summary(contrarians, company, symbol, earnings_date)
@@ -179,7 +213,7 @@ class MasterContrarianDatabase:
     
     def _update_existing_author(self, author_data: Dict, company: str, symbol: str, 
                               earnings_date: str, contrarian_type: str, 
-                              was_correct: Optional[bool], contrarian_score: float):
+                              was_correct: Optional[bool], contrarian_score: float, updated_at: str):
         """Update existing author's record"""
         # Update basic counts
         author_data['Total_Earnings_Calls'] = int(author_data.get('Total_Earnings_Calls', 0)) + 1
@@ -230,11 +264,12 @@ class MasterContrarianDatabase:
         # Determine risk level
         author_data['Risk_Level'] = self._calculate_risk_level(author_data)
         
-        author_data['Last_Updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        author_data['Last_Updated'] = updated_at
     
     def _create_new_author_record(self, author_name: str, author_id: str, company: str, 
                                 symbol: str, earnings_date: str, contrarian_type: str, 
-                                was_correct: Optional[bool], contrarian_score: float) -> Dict:
+                                was_correct: Optional[bool], contrarian_score: float,
+                                updated_at: str) -> Dict:
         """Create a new author record"""
         return {
             'Author_ID': author_id,
@@ -258,7 +293,7 @@ class MasterContrarianDatabase:
             'Repeat_Contrarian_Count': 0,
             'Consistency_Score': 100.0,  # First call is 100% consistent
             'Risk_Level': 'New',
-            'Last_Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'Last_Updated': updated_at
         }
     
     def _calculate_risk_level(self, author_data: Dict) -> str:
@@ -281,7 +316,7 @@ class MasterContrarianDatabase:
     
     def _save_author_history(self, author_id: str, author_name: str, company: str, 
                            symbol: str, earnings_date: str, contrarian_data: Dict, 
-                           was_correct: Optional[bool]):
+                           was_correct: Optional[bool], updated_at: str):
         """Save individual author's contrarian history"""
         history_file = os.path.join(self.author_history_dir, f"{author_id}_history.csv")
         
@@ -319,7 +354,7 @@ class MasterContrarianDatabase:
                 key_concerns_str = str(key_concerns) if key_concerns else ''
             
             row = {
-                'Date_Added': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'Date_Added': updated_at,
                 'Author_Name': author_name,
                 'Company': company,
                 'Symbol': symbol,
@@ -356,8 +391,25 @@ class MasterContrarianDatabase:
             for author_data in data.values():
                 writer.writerow(author_data)
         
+        self._save_parquet_mirror(data, headers)
         print(f"Master database updated: {self.master_csv_path}")
     
+    def _save_parquet_mirror(self, data: Dict[str, Dict], headers: List[str]):
+        """Mirror the master database to Parquet for fast columnar reads (CSV stays the source of truth)"""
+        if not PYARROW_AVAILABLE:
+            return
+        
+        try:
+            df = pd.DataFrame(list(data.values()), columns=headers)
+            # Holds True/False/'Unknown', which Parquet cannot store in one column
+            df['Latest_Was_Correct'] = df['Latest_Was_Correct'].astype(str)
+            df.to_parquet(self.master_parquet_path, index=False, engine='pyarrow')
+        except Exception as e:
+            print(f"Error writing Parquet mirror: {e}")
+            # Never leave a stale mirror behind the CSV
+            if os.path.exists(self.master_parquet_path):
+                os.remove(self.master_parquet_path)
+    
     def _generate_update_summary(self, contrarians: List[Dict], company: str, 
                                symbol: str, earnings_date: str):
         """Generate a summary of the database update"""
@@ -374,6 +426,23 @@ class MasterContrarianDatabase:
         print(f"Database Location: {self.master_csv_path}")
         print(f"Author Histories: {self.author_history_dir}")
     
+    def load_master_dataframe(self) -> pd.DataFrame:
+        """Load a copy of the master database, parsing the CSV only when the file has changed"""
+        try:
+            stat = os.stat(self.master_csv_path)
+        except FileNotFoundError:
+            return pd.DataFrame()
+        
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key != self._df_cache_key:
+            self._df_cache = pd.read_csv(
+                self.master_csv_path,
+                dtype=MASTER_DTYPES,
+                engine='pyarrow' if PYARROW_AVAILABLE else 'c'
+            )
+            self._df_cache_key = key
+        return self._df_cache.copy()
+    
     def get_author_history(self, author_name: str) -> Optional[pd.DataFrame]:
         """Get the complete history for a specific author"""
         author_id = self._generate_author_id(author_name)
@@ -386,19 +455,17 @@ class MasterContrarianDatabase:
     
     def get_top_contrarians(self, limit: int = 10, sort_by: str = 'Contrarian_Success_Rate') -> pd.DataFrame:
         """Get top contrarians from the master database"""
-        if os.path.exists(self.master_csv_path):
-            df = pd.read_csv(self.master_csv_path)
-            return df.nlargest(limit, sort_by)
-        else:
-            return pd.DataFrame()
+        df = self.load_master_dataframe()
+        if df.empty:
+            return df
+        return df.nlargest(limit, sort_by)
     
     def get_repeat_contrarians(self, min_instances: int = 2) -> pd.DataFrame:
         """Get authors who have been contrarians multiple times"""
-        if os.path.exists(self.master_csv_path):
-            df = pd.read_csv(self.master_csv_path)
-            return df[df['Total_Contrarian_Instances'] >= min_instances]
-        else:
-            return pd.DataFrame()
+        df = self.load_master_dataframe()
+        if df.empty:
+            return df
+        return df[df['Total_Contrarian_Instances'] >= min_instances]
 
 def main():
     """Example usage of the Master Contrarian Database"""
@@ -23,12 +23,20 @@ from collections import defaultdict, Counter
 import yfinance as yf
 from groq import Groq
 import logging
+import threading
 import time
 from typing import List, Dict, Optional
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, fields
 import csv
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -55,9 +63,29 @@ class ContrarianRecord:
     date_analyzed: str
     headline: str
     url: str
+    
+    def to_row(self) -> tuple:
+        """Return the record as a tuple in contrarian_records.csv column order"""
+        return (
+            self.author, self.company, self.symbol, self.earnings_date,
+            self.prediction, self.sentiment, self.was_contrarian,
+            self.was_correct, self.actual_result, self.date_analyzed,
+            self.headline, self.url
+        )
+
+RECORD_COLUMNS = [field.name for field in fields(ContrarianRecord)]
+BOOL_RECORD_COLUMNS = [field.name for field in fields(ContrarianRecord) if field.type is bool]
+
+if PYARROW_AVAILABLE:
+    # One explicit schema for every records shard, so shards written from CSV,
+    # DataFrames and records always share column types
+    RECORD_SCHEMA = pa.schema([
+        (field.name, pa.bool_() if field.type is bool else pa.string())
+        for field in fields(ContrarianRecord)
+    ])
 
 class SimplifiedContrarianAnalyzer:
-    def __init__(self):
+    def __init__(self, write_csv: bool = True):
         load_dotenv()
         self.guardian_api_key = os.getenv("GUARDIAN_API_KEY")
         self.groq_api_key = os.getenv("GROQ_API_KEY")
@@ -73,22 +101,42 @@ class SimplifiedContrarianAnalyzer:
         self.database_dir = "simplified_contrarian_db"
         self.records_file = os.path.join(self.database_dir, "contrarian_records.csv")
         self.author_stats_file = os.path.join(self.database_dir, "author_statistics.csv")
+        self.records_parquet_dir = os.path.join(self.database_dir, "contrarian_records")
+        self.author_stats_parquet = os.path.join(self.database_dir, "author_statistics.parquet")
+        
+        # Parquet is the primary store when pyarrow is installed; CSV is kept for compatibility
+        self.use_parquet = PYARROW_AVAILABLE
+        self.write_csv = write_csv or not self.use_parquet
+        
+        # Serializes CSV writes when analyses run on multiple threads
+        self._db_lock = threading.Lock()
         
         # Create database directory
         os.makedirs(self.database_dir, exist_ok=True)
         self._initialize_database()
         
     def _initialize_database(self):
-        """Initialize CSV files if they don't exist"""
+        """Initialize database files if they don't exist"""
+        # Initialize Parquet records directory, seeding it from any existing CSV records
+        if self.use_parquet and not os.path.isdir(self.records_parquet_dir):
+            os.makedirs(self.records_parquet_dir)
+            if os.path.exists(self.records_file):
+                existing = pd.read_csv(self.records_file, dtype=str, keep_default_na=False)
+                if not existing.empty:
+                    for column in BOOL_RECORD_COLUMNS:
+                        existing[column] = existing[column] == 'True'
+                    pq.write_table(
+                        pa.Table.from_pandas(existing, schema=RECORD_SCHEMA, preserve_index=False),
+                        self._new_records_shard()
+                    )
+        
+        if not self.write_csv:
+            return
+        
         # Initialize records file
         if not os.path.exists(self.records_file):
-            headers = [
-                'author', 'company', 'symbol', 'earnings_date', 'prediction',
-                'sentiment', 'was_contrarian', 'was_correct', 'actual_result',
-                'date_analyzed', 'headline', 'url'
-            ]
             with open(self.records_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
+                writer = csv.DictWriter(f, fieldnames=RECORD_COLUMNS)
                 writer.writeheader()
         
         # Initialize author stats file
@@ -103,6 +151,27 @@ class SimplifiedContrarianAnalyzer:
                 writer = csv.DictWriter(f, fieldnames=headers)
                 writer.writeheader()
     
+    def _new_records_shard(self) -> str:
+        """Return a fresh Parquet shard path so appends never rewrite existing files"""
+        return os.path.join(
+            self.records_parquet_dir,
+            f"records-{datetime.now().strftime('%Y%m')}-{time.time_ns()}.parquet"
+        )
+    
+    def load_records(self) -> pd.DataFrame:
+        """Load all contrarian records from Parquet shards or the CSV file"""
+        if self.use_parquet:
+            if not any(name.endswith('.parquet') for name in os.listdir(self.records_parquet_dir)):
+                return pd.DataFrame(columns=RECORD_COLUMNS)
+            return pd.read_parquet(self.records_parquet_dir, schema=RECORD_SCHEMA)
+        return pd.read_csv(self.records_file)
+    
+    def load_author_statistics(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load author statistics, preferring the Parquet copy when present"""
+        if self.use_parquet and os.path.exists(self.author_stats_parquet):
+            return pd.read_parquet(self.author_stats_parquet, columns=columns)
+        return pd.read_csv(self.author_stats_file, usecols=columns)
+    
     def collect_pre_earnings_articles(self, company_name: str, earnings_date: str, days_before: int = 30) -> List[Dict]:
         """Collect articles from Guardian API before earnings date"""
         try:
@@ -260,8 +329,8 @@ class SimplifiedContrarianAnalyzer:
             return []
         
         # Count consensus
-        sentiment_counts = Counter([article['analysis']['sentiment'] for article in valid_articles])
-        prediction_counts = Counter([article['analysis']['earnings_prediction'] for article in valid_articles])
+        sentiment_counts = Counter(article['analysis']['sentiment'] for article in valid_articles)
+        prediction_counts = Counter(article['analysis']['earnings_prediction'] for article in valid_articles)
         
         # Determine consensus (most common view)
         consensus_sentiment = sentiment_counts.most_common(1)[0][0]
@@ -271,6 +340,7 @@ class SimplifiedContrarianAnalyzer:
         logger.info(f"Consensus prediction: {consensus_prediction}")
         
         contrarian_records = []
+        today = datetime.now().strftime('%Y-%m-%d')
         
         for article in valid_articles:
             analysis = article['analysis']
@@ -307,7 +377,7 @@ class SimplifiedContrarianAnalyzer:
                 was_contrarian=is_contrarian,
                 was_correct=was_correct,
                 actual_result=actual_result['result'] if actual_result else 'unknown',
-                date_analyzed=datetime.now().strftime('%Y-%m-%d'),
+                date_analyzed=today,
                 headline=article['headline'],
                 url=article['url']
             )
@@ -317,23 +387,43 @@ class SimplifiedContrarianAnalyzer:
         return contrarian_records
     
     def save_records(self, records: List[ContrarianRecord]):
-        """Save contrarian records to CSV"""
-        with open(self.records_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            for record in records:
-                writer.writerow([
-                    record.author, record.company, record.symbol, record.earnings_date,
-                    record.prediction, record.sentiment, record.was_contrarian,
-                    record.was_correct, record.actual_result, record.date_analyzed,
-                    record.headline, record.url
-                ])
+        """Save contrarian records to the database"""
+        with self._db_lock:
+            if self.use_parquet and records:
+                table = pa.Table.from_pylist([asdict(record) for record in records], schema=RECORD_SCHEMA)
+                pq.write_table(table, self._new_records_shard())
+            
+            if self.write_csv:
+                with open(self.records_file, 'a', newline='', encoding='utf-8', buffering=1 << 16) as f:
+                    writer = csv.writer(f)
+                    writer.writerows(record.to_row() for record in records)
         
         logger.info(f"Saved {len(records)} records to database")
     
+    def save_records_df(self, df: pd.DataFrame):
+        """Save a DataFrame of contrarian records (RECORD_COLUMNS schema) in one write"""
+        df = df.reindex(columns=RECORD_COLUMNS)
+        
+        with self._db_lock:
+            if self.use_parquet and not df.empty:
+                pq.write_table(
+                    pa.Table.from_pandas(df, schema=RECORD_SCHEMA, preserve_index=False),
+                    self._new_records_shard()
+                )
+            
+            if self.write_csv:
+                df.to_csv(
+                    self.records_file, mode='a', index=False,
+                    header=not os.path.exists(self.records_file), encoding='utf-8'
+                )
+        
+        logger.info(f"Saved {len(df)} records to database")
+    
     def update_author_statistics(self):
         """Update author statistics based on all records"""
         # Load all records
-        df = pd.read_csv(self.records_file)
+        with self._db_lock:
+            df = self.load_records()
         
         author_stats = {}
         
@@ -379,20 +469,25 @@ class SimplifiedContrarianAnalyzer:
                 'specialization': specialization
             }
         
-        # Save to CSV
-        with open(self.author_stats_file, 'w', newline='', encoding='utf-8') as f:
-            if author_stats:
-                fieldnames = list(author_stats[list(author_stats.keys())[0]].keys())
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for stats in author_stats.values():
-                    writer.writerow(stats)
+        # Save to Parquet and/or CSV
+        with self._db_lock:
+            if self.use_parquet and author_stats:
+                pq.write_table(pa.Table.from_pylist(list(author_stats.values())), self.author_stats_parquet)
+            
+            if self.write_csv:
+                with open(self.author_stats_file, 'w', newline='', encoding='utf-8') as f:
+                    if author_stats:
+                        fieldnames = list(author_stats[list(author_stats.keys())[0]].keys())
+                        writer = csv.DictWriter(f, fieldnames=fieldnames)
+                        writer.writeheader()
+                        for stats in author_stats.values():
+                            writer.writerow(stats)
         
         logger.info(f"Updated statistics for {len(author_stats)} authors")
     
     def get_investment_signals(self, company_symbol: str) -> Dict:
         """Generate simple investment signals based on contrarian analysis"""
-        df = pd.read_csv(self.author_stats_file)
+        df = self.load_author_statistics()
         
         # Find authors with high contrarian accuracy (>60%) and recent activity
         reliable_contrarians = df[